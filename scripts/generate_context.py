@@ -20,6 +20,9 @@ How to Run:
     Optional: Specify an output filename
     python scripts/generate_context.py ./src --output my_project_context.md
 
+    Optional: Set the number of reader threads (1 = sequential streaming)
+    python scripts/generate_context.py ./src --jobs 8
+
 Requirements:
     - Python 3.13+
     - No external libraries required (uses standard library only).
@@ -27,6 +30,10 @@ Requirements:
 
 import os
 import argparse
+import shutil
+import tempfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # --- Configuration ---
@@ -44,6 +51,12 @@ IGNORE_DIRS = {
     "migrations",
 }
 
+# Chunk size used when streaming file contents into the output file
+COPY_BUFFER_SIZE = 64 * 1024
+
+# Default number of reader threads (--jobs)
+DEFAULT_JOBS = 4
+
 # File extensions to include (add more if needed)
 INCLUDE_EXTENSIONS = {
     ".py",
@@ -61,44 +74,158 @@ INCLUDE_EXTENSIONS = {
 }
 
 
-def generate_tree(start_path):
-    """Generates a string directory tree structure."""
-    tree_str = f"Directory Tree for: {start_path}\n\n"
-    start_path = Path(start_path)
+def _walk(top, rel_top="", depth=1):
+    """
+    Yields (rel_path, depth, is_dir, entry) for every kept entry under `top`.
 
-    for root, dirs, files in os.walk(start_path):
-        # Modify dirs in-place to skip ignored directories
-        dirs[:] = [d for d in dirs if d not in IGNORE_DIRS]
+    Uses os.scandir so the file type comes straight from the directory read
+    instead of an extra stat() per entry. Order matches os.walk top-down: a
+    directory's files first, then each subdirectory followed by its contents.
+    """
+    subdirs = []
+    with os.scandir(top) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in IGNORE_DIRS:
+                    subdirs.append(entry)
+            elif os.path.splitext(entry.name)[1] in INCLUDE_EXTENSIONS:
+                yield os.path.join(rel_top, entry.name), depth, False, entry
 
-        level = root.replace(str(start_path), "").count(os.sep)
-        indent = " " * 4 * (level)
-        tree_str += f"{indent}{os.path.basename(root)}/\n"
-        subindent = " " * 4 * (level + 1)
-        for f in files:
-            if Path(f).suffix in INCLUDE_EXTENSIONS:
-                tree_str += f"{subindent}{f}\n"
+    for entry in subdirs:
+        rel_path = os.path.join(rel_top, entry.name)
+        yield rel_path, depth, True, entry
+        yield from _walk(entry.path, rel_path, depth + 1)
 
-    return tree_str
 
+def scan_directory(start_path):
+    """
+    Walks the tree once, building the directory tree string and the file list.
 
-def collect_files(start_path):
-    """Yields file paths and contents."""
+    Returns:
+        (tree_str, files) where files is a list of (rel_path, file_path) tuples
+        in tree order. rel_path is relative to the input folder's parent for
+        cleaner headers.
+    """
+    tree_parts = [f"Directory Tree for: {start_path}\n\n"]
     start_path = Path(start_path)
+    files = []
+
+    tree_parts.append(f"{os.path.basename(start_path)}/\n")
+    for rel_path, depth, is_dir, entry in _walk(start_path, start_path.name):
+        indent = " " * 4 * depth
+        if is_dir:
+            tree_parts.append(f"{indent}{entry.name}/\n")
+        else:
+            tree_parts.append(f"{indent}{entry.name}\n")
+            files.append((Path(rel_path), entry.path))
+
+    return "".join(tree_parts), files
+
+
+def write_file_block(outfile, rel_path, file_path):
+    """
+    Streams one file into the output as a fenced code block.
+
+    The first chunk is read before anything is written so unreadable files
+    (missing, binary, wrong encoding) are skipped without leaving a dangling
+    header. The rest is copied in COPY_BUFFER_SIZE chunks, so memory stays
+    bounded regardless of file size. If a later chunk fails to decode, the
+    partial block is truncated away and the file is skipped, as with --jobs > 1.
+
+    Returns:
+        True if the block was written, False if the file was skipped.
+    """
+    try:
+        f = open(file_path, encoding="utf-8")
+    except Exception as e:
+        print(f"Skipping {file_path}: {e}")
+        return False
+
+    with f:
+        try:
+            first_chunk = f.read(COPY_BUFFER_SIZE)
+        except Exception as e:
+            print(f"Skipping {file_path}: {e}")
+            return False
+
+        extension = rel_path.suffix.lstrip(".")
+        block_start = outfile.tell()
+        # Format: File path header followed by code block
+        outfile.write(f"### `{rel_path}`\n\n")
+        outfile.write(f"```{extension}\n")
+        outfile.write(first_chunk)
+        try:
+            shutil.copyfileobj(f, outfile, COPY_BUFFER_SIZE)
+        except Exception as e:
+            print(f"Skipping {file_path}: {e}")
+            outfile.seek(block_start)
+            outfile.truncate()
+            return False
+        outfile.write("\n```\n\n")
+
+    return True
+
+
+def read_file(file_path):
+    """
+    Copies one file into a temporary spool for the parallel path. Up to
+    COPY_BUFFER_SIZE is kept in memory; larger bodies spill to disk.
+    Returns the spool rewound to the start, or None if the file can't be read.
+    """
+    spool = tempfile.SpooledTemporaryFile(
+        max_size=COPY_BUFFER_SIZE, mode="w+", encoding="utf-8"
+    )
+    try:
+        with open(file_path, encoding="utf-8") as f:
+            shutil.copyfileobj(f, spool, COPY_BUFFER_SIZE)
+    except Exception as e:
+        print(f"Skipping {file_path}: {e}")
+        spool.close()
+        return None
+    spool.seek(0)
+    return spool
+
 
-    for root, dirs, files in os.walk(start_path):
-        dirs[:] = [d for d in dirs if d not in IGNORE_DIRS]
+def write_files_parallel(outfile, files, jobs):
+    """
+    Reads files on a thread pool and writes them in tree order.
 
-        for file in files:
-            file_path = Path(root) / file
-            if file_path.suffix in INCLUDE_EXTENSIONS:
-                try:
-                    with open(file_path, encoding="utf-8") as f:
-                        content = f.read()
-                        # Calculate path relative to the input folder for cleaner headers
-                        rel_path = file_path.relative_to(start_path.parent)
-                        yield rel_path, content
-                except Exception as e:
-                    print(f"Skipping {file_path}: {e}")
+    At most 2 * jobs reads are in flight, each spooled through a temporary
+    file, so memory stays bounded by 2 * jobs * COPY_BUFFER_SIZE regardless
+    of file size while the writer catches up.
+
+    Returns:
+        The number of files written.
+    """
+    file_count = 0
+    window = 2 * jobs
+    pending = deque()
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        file_iter = iter(files)
+        for rel_path, file_path in file_iter:
+            pending.append((rel_path, executor.submit(read_file, file_path)))
+            if len(pending) >= window:
+                break
+
+        while pending:
+            rel_path, future = pending.popleft()
+            next_file = next(file_iter, None)
+            if next_file is not None:
+                pending.append((next_file[0], executor.submit(read_file, next_file[1])))
+
+            spool = future.result()
+            if spool is None:
+                continue
+
+            extension = rel_path.suffix.lstrip(".")
+            outfile.write(f"### `{rel_path}`\n\n")
+            outfile.write(f"```{extension}\n")
+            with spool:
+                shutil.copyfileobj(spool, outfile, COPY_BUFFER_SIZE)
+            outfile.write("\n```\n\n")
+            file_count += 1
+
+    return file_count
 
 
 def main():
@@ -109,6 +236,14 @@ def main():
     parser.add_argument(
         "--output", "-o", default="codebase_context.md", help="Output file name"
     )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=DEFAULT_JOBS,
+        help=f"Number of threads reading files (default: {DEFAULT_JOBS}; 1 streams files sequentially). "
+        "Both paths stream file bodies in bounded chunks; more jobs overlap disk reads.",
+    )
 
     args = parser.parse_args()
 
@@ -119,25 +254,24 @@ def main():
         return
 
     print(f"Scanning {target_path}...")
+    tree_str, files = scan_directory(target_path)
 
     with open(args.output, "w", encoding="utf-8") as outfile:
         # 1. Write the preamble and directory tree
         outfile.write(f"# Codebase Context: {target_path.name}\n\n")
         outfile.write("## 1. Directory Structure\n```text\n")
-        outfile.write(generate_tree(target_path))
+        outfile.write(tree_str)
         outfile.write("```\n\n")
         outfile.write("---\n\n## 2. File Contents\n\n")
 
         # 2. Write file contents
-        file_count = 0
-        for rel_path, content in collect_files(target_path):
-            extension = rel_path.suffix.lstrip(".")
-            # Format: File path header followed by code block
-            outfile.write(f"### `{rel_path}`\n\n")
-            outfile.write(f"```{extension}\n")
-            outfile.write(content)
-            outfile.write("\n```\n\n")
-            file_count += 1
+        if args.jobs > 1:
+            file_count = write_files_parallel(outfile, files, args.jobs)
+        else:
+            file_count = 0
+            for rel_path, file_path in files:
+                if write_file_block(outfile, rel_path, file_path):
+                    file_count += 1
 
         # Get the final file size
         total_chars = outfile.tell()
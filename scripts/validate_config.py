@@ -28,20 +28,43 @@ import sys
 import yaml  # Requires: pip install PyYAML
 from urllib.parse import urlparse
 
+# Prefer the libyaml-backed C loader; fall back to the pure-Python one if PyYAML
+# was built without libyaml.
+Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
-def is_valid_url(url):
+# Keys every source entry must define.
+_REQUIRED_KEYS = ("name", "url", "type", "format", "rank")
+
+# Allowed values for the enum-like source fields.
+_VALID_TYPES = frozenset(("analysis", "datapoint"))
+_VALID_FORMATS = frozenset(("youtube", "webpage"))
+_HTTP_SCHEMES = frozenset(("http", "https"))
+
+
+def parse_url(url):
     """
-    Checks if the URL has a valid structure.
+    Parses the URL and checks it has a valid structure.
     Enforces that a Scheme (http/s) and Netloc (Domain) exist.
+    Returns the parse result, or None if the URL is invalid.
     """
     if not url or not isinstance(url, str):
-        return False
+        return None
     result = urlparse(url)
-    # result.scheme ensures 'https' or 'http' exists
+    # result.scheme must be 'https' or 'http'
     # result.netloc ensures 'www.youtube.com' (the domain) exists
-    if result.scheme and result.netloc:
-        return True
-    return False
+    if result.scheme in _HTTP_SCHEMES and result.netloc:
+        return result
+    return None
+
+
+def is_youtube_host(netloc):
+    """
+    Checks if a URL's netloc belongs to YouTube (youtube.com, youtu.be or a subdomain).
+    """
+    host = netloc.rsplit("@", 1)[-1].split(":", 1)[0].lower()
+    return host in ("youtube.com", "youtu.be") or host.endswith(
+        (".youtube.com", ".youtu.be")
+    )
 
 
 def validate_source(source):
@@ -55,8 +78,7 @@ def validate_source(source):
         return False, "Item is not a valid dictionary."
 
     # 2. Check for missing keys
-    required_keys = ["name", "url", "type", "format", "rank"]
-    for key in required_keys:
+    for key in _REQUIRED_KEYS:
         if key not in source:
             return False, f"Missing required key: '{key}'"
 
@@ -65,23 +87,22 @@ def validate_source(source):
         return False, "Field 'name' must be a valid string."
 
     # 4. Validate 'url' (Must be valid URL with domain)
-    if not is_valid_url(source["url"]):
+    parsed_url = parse_url(source["url"])
+    if parsed_url is None:
         return (
             False,
             f"Field 'url' is invalid (missing http/s or domain): {source.get('url')}",
         )
 
     # 5. Validate 'type' (Strict Enum)
-    valid_types = ["analysis", "datapoint"]
-    if source["type"] not in valid_types:
+    if not isinstance(source["type"], str) or source["type"] not in _VALID_TYPES:
         return (
             False,
             f"Field 'type' must be 'analysis' or 'datapoint'. Found: '{source['type']}'",
         )
 
     # 6. Validate 'format' (Strict Enum)
-    valid_formats = ["youtube", "webpage"]
-    if source["format"] not in valid_formats:
+    if not isinstance(source["format"], str) or source["format"] not in _VALID_FORMATS:
         return (
             False,
             f"Field 'format' must be 'youtube' or 'webpage'. Found: '{source['format']}'",
@@ -89,7 +110,7 @@ def validate_source(source):
 
     # 7. Enforce YouTube URL Rules
     # Check if the URL is a YouTube link
-    is_yt_link = "youtube.com" in source["url"] or "youtu.be" in source["url"]
+    is_yt_link = is_youtube_host(parsed_url.netloc)
 
     if source["format"] == "youtube" and not is_yt_link:
         return (
@@ -127,7 +148,7 @@ def main():
     # Load YAML
     try:
         with open(args.config, encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=Loader)
     except FileNotFoundError:
         print(f"Error: File not found at {args.config}")
         sys.exit(1)
@@ -156,8 +177,11 @@ def main():
 
         if not is_valid:
             has_errors = True
-            # Try to get the name for identification, fallback to index
-            name = source.get("name", f"Item #{i+1}")
+            # Try to get the name for identification, fallback to index.
+            # Structurally broken items (not a dict) go straight to the fallback.
+            name = f"Item #{i+1}"
+            if isinstance(source, dict):
+                name = source.get("name", name)
             print(f"Mistake on source '{name}': {error_msg}")
 
     print("-" * 30)
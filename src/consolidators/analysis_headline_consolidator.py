@@ -22,59 +22,58 @@ class AnalysisHeadlineConsolidator(BaseConsolidator):
         Reads the CSV, sorts by rank, and structures the output.
         """
         try:
-            logger.info(f"Starting consolidation for file: {self.file_path}")
+            logger.info("Starting consolidation for file: %s", self.file_path)
 
             # 1. Read Data
             df = CSVHandler.load_as_dataframe(self.file_path)
-            logger.debug(f"Loaded dataframe with shape: {df.shape}")
+            logger.debug("Loaded dataframe with shape: %s", df.shape)
 
             if df.empty:
-                logger.warning(f"No data found in {self.file_path}")
+                logger.warning("No data found in %s", self.file_path)
                 return AnalysisHeadlines(source_groups=[])
 
             # Validation
             required_cols = {"rank", "source", "title"}
             if not required_cols.issubset(df.columns):
                 logger.error(
-                    f"CSV missing columns. Required: {required_cols}, Found: {set(df.columns)}"
+                    "CSV missing columns. Required: %s, Found: %s",
+                    required_cols,
+                    set(df.columns),
                 )
                 return AnalysisHeadlines(source_groups=[])
 
             # 2. Pre-processing
-            df["rank"] = pd.to_numeric(df["rank"], errors="coerce").fillna(999)
-            logger.debug("Converted 'rank' column to numeric and filled NaNs with 999.")
+            df["rank"] = (
+                pd.to_numeric(df["rank"], errors="coerce").fillna(999).astype("int32")
+            )
+            logger.debug("Converted 'rank' column to int32 and filled NaNs with 999.")
+
+            # Categorical sources sort and group on integer codes; categories are
+            # created in lexical order, so the alphabetical tie-break is unchanged.
+            df["source"] = df["source"].astype("category")
 
             # Sort: Rank 1 first, then alphabetical by source
             df = df.sort_values(by=["rank", "source"], ascending=[True, True])
             logger.info("Sorted dataframe by 'rank' and 'source'.")
 
-            source_groups: List[SourceHeadlines] = []
-
             # 3. Grouping Logic (Flat by Source)
-            # Use dictionary to group titles while preserving sort order
-            source_map = {}
-
-            for _, row in df.iterrows():
-                source = row["source"]
-                title = row["title"]
-
-                if source not in source_map:
-                    source_map[source] = []
-                    logger.debug(f"Creating new group for source: {source}")
-
-                source_map[source].append(title)
-                logger.debug(f"Added title to source '{source}': {title}")
+            # groupby(sort=False) keeps groups in first-appearance order, which
+            # preserves the rank/source sort applied above.
+            grouped = df.groupby("source", sort=False, dropna=False, observed=True)[
+                "title"
+            ].agg(list)
 
             # Convert to Data Class objects
-            for source_name, titles in source_map.items():
-                logger.info(f"Source '{source_name}' has {len(titles)} titles.")
+            source_groups: List[SourceHeadlines] = []
+            for source_name, titles in grouped.items():
+                logger.info("Source '%s' has %d titles.", source_name, len(titles))
                 group = SourceHeadlines(source_name=source_name, titles=titles)
                 source_groups.append(group)
 
-            logger.info(f"Consolidation complete. Total sources: {len(source_groups)}")
+            logger.info("Consolidation complete. Total sources: %d", len(source_groups))
             # Return the single object container
             return AnalysisHeadlines(source_groups=source_groups)
 
         except Exception as e:
-            logger.exception(f"Error consolidating headlines: {e}")
+            logger.exception("Error consolidating headlines: %s", e)
             return AnalysisHeadlines(source_groups=[])
@@ -1,18 +1,37 @@
 import logging
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import List, Dict, Optional
+from typing import Iterator, List, Dict, Optional
 
-from dateutil import parser as date_parser
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
+import requests
+from requests.adapters import HTTPAdapter
 
 from interfaces import BaseConsolidator
-from interfaces.models import MainstreamSourceEntry, MainstreamHeadlines
+from interfaces.models import MainstreamSourceEntry, MainstreamHeadlines, SourceType
 from legacy_modules.content_extractor import ContentExtractor
+from managers.cache_manager import CacheManager
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on sources fetched concurrently.
+MAX_WORKERS = 16
+
+# YouTube Data API v3 REST endpoint (called directly over a pooled Session).
+YOUTUBE_API_BASE_URL = "https://www.googleapis.com/youtube/v3"
+YOUTUBE_API_TIMEOUT = 30
+
+# Channel handle (e.g. '@ChannelName') from a youtube.com channel URL
+_HANDLE_RE = re.compile(r"youtube\.com/(@[A-Za-z0-9_.-]+)")
+
+# Uploads are fetched in small pages until the 7-day cutoff is reached,
+# capped at MAX_PLAYLIST_PAGES * PLAYLIST_PAGE_SIZE videos per channel.
+PLAYLIST_PAGE_SIZE = 20
+MAX_PLAYLIST_PAGES = 3
+
+# Handle -> uploads playlist rarely changes; re-resolve monthly (or on a 404)
+HANDLE_CACHE_TTL_SECONDS = 30 * 24 * 60 * 60
+
 
 class MainstreamHeadlineConsolidator(BaseConsolidator):
     """
@@ -28,17 +47,23 @@ class MainstreamHeadlineConsolidator(BaseConsolidator):
         # Initialize ContentExtractor
         self.content_extractor = ContentExtractor(self.config)
 
-        # Initialize YouTube Service
-        self.youtube_service = None
+        # Handle -> uploads playlist ID. Entries expire, and a 404 from the
+        # playlist fetch drops the stale entry so the next run re-resolves it.
+        self._handle_cache = CacheManager(
+            "youtube_handles", ttl_seconds=HANDLE_CACHE_TTL_SECONDS
+        )
+
+        # Initialize YouTube Session
+        # One pooled, keep-alive Session shared by all worker threads, so the
+        # TLS handshake to googleapis.com is paid once rather than per call.
+        self.youtube_session = None
         if self.api_key:
-            try:
-                logger.debug("Initializing YouTube service with provided API key.")
-                self.youtube_service = build("youtube", "v3", developerKey=self.api_key)
-                logger.info("YouTube service initialized successfully.")
-            except Exception as e:
-                logger.error(
-                    f"Failed to initialize YouTube service: {e}", exc_info=True
-                )
+            logger.debug("Initializing YouTube API session with provided API key.")
+            self.youtube_session = requests.Session()
+            self.youtube_session.mount(
+                "https://", HTTPAdapter(pool_connections=10, pool_maxsize=MAX_WORKERS)
+            )
+            logger.info("YouTube API session initialized successfully.")
         else:
             logger.warning("No YouTube API key found. YouTube sources will be skipped.")
 
@@ -56,54 +81,103 @@ class MainstreamHeadlineConsolidator(BaseConsolidator):
             logger.warning("No sources with type='datapoint' found in config.")
             return []
 
-        consolidated_entries: List[MainstreamSourceEntry] = []
+        # Sources are I/O-bound (API round-trips, page loads), so fetch them
+        # concurrently. map() keeps results in config order.
+        max_workers = min(MAX_WORKERS, len(datapoint_sources))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(self._process_source, datapoint_sources))
 
-        for source in datapoint_sources:
-            name = source.get("name")
-            url = source.get("url")
-            fmt = source.get("format")  # 'youtube' or 'webpage'
+        consolidated_entries: List[MainstreamSourceEntry] = [
+            entry for entry in results if entry is not None
+        ]
 
-            if not name or not url:
-                logger.warning(f"Skipping source with missing name or url: {source}")
-                continue
+        logger.info(
+            f"Consolidation complete. Total entries: {len(consolidated_entries)}"
+        )
+        # Return the single object directly (NO LIST WRAPPER)
+        return MainstreamHeadlines(entries=consolidated_entries)
 
-            logger.info(
-                f"Processing Mainstream source: {name} (format: {fmt}, url: {url})"
-            )
+    def _process_source(self, source: Dict) -> Optional[MainstreamSourceEntry]:
+        """
+        Fetches content for a single datapoint source based on its format.
+        Returns None if the source is skipped or yields no content.
+        """
+        name = source.get("name")
+        url = source.get("url")
+        fmt = source.get("format")  # 'youtube' or 'webpage'
 
-            content_data: List[str] = []
-
-            # Strategy Pattern based on format
-            if fmt == "youtube":
-                logger.info(f"Fetching YouTube titles for channel: {name} ({url})")
-                content_data = self._fetch_youtube_titles(name, url)
-            elif fmt == "webpage":
-                logger.info(f"Extracting webpage content from: {url}")
-                text = self._fetch_webpage_content(url)
-                if text:
-                    content_data = [text]  # Wrap single text in list
-                    logger.info(
-                        f"Webpage content extracted for {name} (length: {len(text)})"
-                    )
-                else:
-                    logger.warning(f"No content extracted from webpage: {url}")
-            else:
-                logger.warning(f"Unknown format '{fmt}' for source '{name}'. Skipping.")
+        if not name or not url:
+            logger.warning(f"Skipping source with missing name or url: {source}")
+            return None
+
+        logger.info(f"Processing Mainstream source: {name} (format: {fmt}, url: {url})")
+
+        content_data: List[str] = []
 
-            if content_data:
-                logger.info(f"Adding {len(content_data)} entries for source: {name}")
-                entry = MainstreamSourceEntry(
-                    source_name=name, content=content_data, source_type=fmt
+        try:
+            source_type = SourceType(fmt)
+        except ValueError:
+            logger.warning(f"Unknown format '{fmt}' for source '{name}'. Skipping.")
+            return None
+
+        # Strategy Pattern based on format
+        if source_type is SourceType.YOUTUBE:
+            logger.info(f"Fetching YouTube titles for channel: {name} ({url})")
+            content_data = self._fetch_youtube_titles(name, url)
+        else:
+            logger.info(f"Extracting webpage content from: {url}")
+            text = self._fetch_webpage_content(url)
+            if text:
+                content_data = [text]  # Wrap single text in list
+                logger.info(
+                    f"Webpage content extracted for {name} (length: {len(text)})"
                 )
-                consolidated_entries.append(entry)
             else:
-                logger.warning(f"No content data found for source: {name}")
+                logger.warning(f"No content extracted from webpage: {url}")
 
-        logger.info(
-            f"Consolidation complete. Total entries: {len(consolidated_entries)}"
+        if content_data:
+            logger.info(f"Adding {len(content_data)} entries for source: {name}")
+            return MainstreamSourceEntry(
+                source_name=name, content=content_data, source_type=source_type
+            )
+
+        logger.warning(f"No content data found for source: {name}")
+        return None
+
+    def _youtube_get(self, resource: str, **params) -> Dict:
+        """
+        Calls a YouTube Data API list endpoint (e.g. 'channels') and returns the JSON body.
+        Raises requests.HTTPError on non-2xx responses.
+        """
+        params["key"] = self.api_key
+        response = self.youtube_session.get(
+            f"{YOUTUBE_API_BASE_URL}/{resource}",
+            params=params,
+            timeout=YOUTUBE_API_TIMEOUT,
         )
-        # Return the single object directly (NO LIST WRAPPER)
-        return MainstreamHeadlines(entries=consolidated_entries)
+        response.raise_for_status()
+        return response.json()
+
+    def _resolve_uploads_id(self, handle: str) -> Optional[str]:
+        """
+        Looks up the uploads playlist ID for a channel handle.
+        channels?forHandle= costs 1 quota unit, versus 100 for a search
+        plus a second channels round-trip.
+        """
+        logger.info(f"Fetching uploads playlist ID for handle: {handle}")
+        channel_res = self._youtube_get(
+            "channels",
+            forHandle=handle,
+            part="contentDetails",
+            maxResults=1,
+            fields="items(contentDetails/relatedPlaylists/uploads)",
+        )
+
+        if not channel_res.get("items"):
+            logger.error(f"Channel not found for handle '{handle}'")
+            return None
+
+        return channel_res["items"][0]["contentDetails"]["relatedPlaylists"]["uploads"]
 
     def _fetch_webpage_content(self, url: str) -> Optional[str]:
         """Delegates to the existing ContentExtractor class."""
@@ -122,78 +196,90 @@ class MainstreamHeadlineConsolidator(BaseConsolidator):
         """
         Fetches video titles published in the last 7 days.
         """
-        if not self.youtube_service:
+        try:
+            titles = list(self._iter_youtube_titles(channel_name, channel_url))
+        except requests.HTTPError as e:
+            logger.error(f"YouTube API Error for {channel_name}: {e}", exc_info=True)
+            handle_match = _HANDLE_RE.search(channel_url)
+            if e.response is not None and e.response.status_code == 404 and handle_match:
+                # Cached uploads playlist no longer exists; re-resolve next run
+                self._handle_cache.delete(handle_match.group(1))
+            return []
+        except Exception as e:
+            logger.error(f"Unexpected error for {channel_name}: {e}", exc_info=True)
+            return []
+
+        logger.info(f"Fetched {len(titles)} titles from {channel_name}")
+        return titles
+
+    def _iter_youtube_titles(
+        self, channel_name: str, channel_url: str
+    ) -> Iterator[str]:
+        """
+        Lazily yields titles of videos published in the last 7 days, newest first.
+        Playlist pages are only requested as the caller keeps consuming, so taking
+        a prefix (e.g. itertools.islice) avoids fetching further pages.
+        API errors propagate to the caller.
+        """
+        if not self.youtube_session:
             logger.warning(
-                f"YouTube service not initialized. Skipping channel: {channel_name}"
+                f"YouTube API session not initialized. Skipping channel: {channel_name}"
             )
-            return []
+            return
 
-        handle_match = re.search(r"youtube\.com/(@[A-Za-z0-9_.-]+)", channel_url)
+        handle_match = _HANDLE_RE.search(channel_url)
         if not handle_match:
             logger.error(f"Could not extract handle from URL: {channel_url}")
-            return []
+            return
         handle = handle_match.group(1)
         logger.info(f"Extracted YouTube handle '{handle}' from URL: {channel_url}")
 
-        try:
-            # 1. Get Channel ID
-            logger.info(f"Searching for channel ID using handle: {handle}")
-            search_res = (
-                self.youtube_service.search()
-                .list(q=handle, part="id", type="channel", maxResults=1)
-                .execute()
-            )
-
-            if not search_res.get("items"):
-                logger.error(f"Channel ID not found for handle '{handle}'")
-                return []
+        # 1. Resolve the handle straight to its uploads playlist.
+        uploads_id = self._handle_cache.get(handle)
+        if uploads_id:
+            logger.info(f"Using cached uploads playlist ID for handle: {handle}")
+        else:
+            uploads_id = self._resolve_uploads_id(handle)
+            if not uploads_id:
+                return
+            self._handle_cache.set(handle, uploads_id)
 
-            channel_id = search_res["items"][0]["id"]["channelId"]
-            logger.info(f"Found channel ID '{channel_id}' for handle '{handle}'")
+        logger.info(f"Uploads playlist ID for channel '{channel_name}': {uploads_id}")
 
-            # 2. Get Uploads Playlist ID
-            logger.info(f"Fetching uploads playlist ID for channel ID: {channel_id}")
-            channel_res = (
-                self.youtube_service.channels()
-                .list(id=channel_id, part="contentDetails")
-                .execute()
-            )
-
-            uploads_id = channel_res["items"][0]["contentDetails"]["relatedPlaylists"][
-                "uploads"
-            ]
-            logger.info(
-                f"Uploads playlist ID for channel '{channel_name}': {uploads_id}"
-            )
-
-            # 3. Fetch Videos (Last 7 Days)
-            one_week_ago = datetime.now(timezone.utc) - timedelta(days=7)
-            logger.info(
-                f"Fetching videos from uploads playlist '{uploads_id}' published after {one_week_ago.isoformat()}"
-            )
-            playlist_res = (
-                self.youtube_service.playlistItems()
-                .list(playlistId=uploads_id, part="snippet", maxResults=60)
-                .execute()
+        # 2. Fetch Videos (Last 7 Days)
+        one_week_ago = datetime.now(timezone.utc) - timedelta(days=7)
+        logger.info(
+            f"Fetching videos from uploads playlist '{uploads_id}' published after {one_week_ago.isoformat()}"
+        )
+        # Uploads playlists are newest-first: stop at the first video older
+        # than the cutoff and only request another page if still in-window.
+        page_token = None
+        for _ in range(MAX_PLAYLIST_PAGES):
+            # requests drops params whose value is None (first page)
+            playlist_res = self._youtube_get(
+                "playlistItems",
+                playlistId=uploads_id,
+                part="snippet",
+                maxResults=PLAYLIST_PAGE_SIZE,
+                pageToken=page_token,
+                fields="items(snippet(title,publishedAt)),nextPageToken",
             )
 
-            titles = []
             for item in playlist_res.get("items", []):
                 snippet = item["snippet"]
-                published = date_parser.isoparse(snippet["publishedAt"])
+                # fromisoformat only accepts a trailing 'Z' from Python 3.11
+                published = datetime.fromisoformat(
+                    snippet["publishedAt"].replace("Z", "+00:00")
+                )
 
-                if published >= one_week_ago:
-                    titles.append(snippet["title"])
-                    logger.info(
-                        f"Added video '{snippet['title']}' published at {published}"
-                    )
+                if published < one_week_ago:
+                    return
 
-            logger.info(f"Fetched {len(titles)} titles from {channel_name}")
-            return titles
+                logger.info(
+                    f"Added video '{snippet['title']}' published at {published}"
+                )
+                yield snippet["title"]
 
-        except HttpError as e:
-            logger.error(f"YouTube API Error for {channel_name}: {e}", exc_info=True)
-            return []
-        except Exception as e:
-            logger.error(f"Unexpected error for {channel_name}: {e}", exc_info=True)
-            return []
+            page_token = playlist_res.get("nextPageToken")
+            if not page_token:
+                return
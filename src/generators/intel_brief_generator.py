@@ -1,6 +1,7 @@
 import logging
-from typing import Any
+from typing import Any, List, Optional
 from interfaces import BaseGenerator
+from managers.cache_manager import CacheManager
 from interfaces.models import Article
 
 logger = logging.getLogger(__name__)
@@ -9,6 +10,11 @@ logger = logging.getLogger(__name__)
 MINIMUM_CONTENT_LENGTH = 150
 MODEL_NAME = "Gemini-3-Flash"  # Fast, efficient model for summarization
 
+# Long articles are cut to their lead and conclusion to cap prompt cost
+MAX_PROMPT_CHARS = 20000
+TRUNCATE_HEAD_CHARS = 16000
+TRUNCATE_TAIL_CHARS = 4000
+
 SUMMARY_PROMPT_TEMPLATE = """
 **Role:** You are an elite Intelligence Analyst processing raw source documents for a high-level decision-maker.
 
@@ -38,6 +44,9 @@ SUMMARY_PROMPT_TEMPLATE = """
 {content}
 """
 
+# Split once so each prompt is built by concatenation rather than str.format
+_PROMPT_PRE, _PROMPT_POST = SUMMARY_PROMPT_TEMPLATE.split("{content}")
+
 
 class IntelBriefGenerator(BaseGenerator):
     """
@@ -45,39 +54,92 @@ class IntelBriefGenerator(BaseGenerator):
     Takes a RawArticle and generates a structured 'Triage Card' summary.
     """
 
-    def __init__(self, llm_client: Any):
+    def __init__(self, llm_client: Any, response_cache: Optional[CacheManager] = None):
         """
         Args:
             llm_client: An initialized LLMClient instance.
+            response_cache: Cache for LLM responses. Defaults to the shared on-disk
+                cache; unused when llm_client caches responses itself.
         """
-        self.llm_client = llm_client
+        super().__init__(llm_client, response_cache)
 
     def generate(self, article: Article) -> Article:
         """
         Takes an Article, generates the summary, and returns the enriched Article.
         """
-        logger.info(f"Generating Intel Brief for: '{article.title}'...")
-
-        if not article.raw_content or len(article.raw_content) < MINIMUM_CONTENT_LENGTH:
-            return self._mark_as_failed(article, "Content too short.")
+        return self.generate_many([article])[0]
 
-        try:
-            prompt = SUMMARY_PROMPT_TEMPLATE.format(content=article.raw_content)
+    def generate_many(self, articles: List[Article]) -> List[Article]:
+        """
+        Generates summaries for several Articles with one batched LLM dispatch.
+        Articles with too little content are marked as failed without a call,
+        and prompts answered before are served from the response cache.
 
-            raw_summary = self.llm_client.query(
-                prompt=prompt, provider="poe", model=MODEL_NAME
+        Returns:
+            The same Article objects, enriched, in input order.
+        """
+        pending: List[Article] = []
+        prompts: List[str] = []
+        for article in articles:
+            logger.info(f"Generating Intel Brief for: '{article.title}'...")
+            if (
+                not article.raw_content
+                or len(article.raw_content) < MINIMUM_CONTENT_LENGTH
+            ):
+                self._mark_as_failed(article, "Content too short.")
+                continue
+
+            content = self._truncate_content(article.raw_content)
+            prompt = _PROMPT_PRE + content + _PROMPT_POST
+            cached = (
+                self.response_cache.get(self._response_key(prompt, MODEL_NAME))
+                if self.response_cache is not None
+                else None
             )
+            if cached is not None:
+                logger.info(f"Using cached Intel Brief for: '{article.title}'")
+                article.summary = self._clean_llm_output(cached)
+                continue
 
-            article.summary = self._clean_llm_output(raw_summary)
-            return article
+            pending.append(article)
+            prompts.append(prompt)
 
-        except Exception as e:
-            logger.error(f"Generation error for {article.title}: {e}")
-            return self._mark_as_failed(article, f"Generation Error: {e}")
+        if pending:
+            responses = self.llm_client.query_batch(
+                prompts, provider="poe", model=MODEL_NAME
+            )
+            for article, prompt, response in zip(pending, prompts, responses):
+                if isinstance(response, Exception):
+                    logger.error(f"Generation error for {article.title}: {response}")
+                    self._mark_as_failed(article, f"Generation Error: {response}")
+                    continue
+                if response and self.response_cache is not None:
+                    self.response_cache.set(
+                        self._response_key(prompt, MODEL_NAME), response
+                    )
+                article.summary = self._clean_llm_output(response)
+
+        return articles
+
+    def _truncate_content(self, content: str) -> str:
+        """Keeps the first and last parts of over-long content."""
+        if len(content) <= MAX_PROMPT_CHARS:
+            return content
+        logger.info(
+            f"Truncating content from {len(content)} to ~{MAX_PROMPT_CHARS} characters."
+        )
+        return (
+            content[:TRUNCATE_HEAD_CHARS]
+            + "\n...[truncated]...\n"
+            + content[-TRUNCATE_TAIL_CHARS:]
+        )
 
     def _clean_llm_output(self, text: str) -> str:
         if not text:
             return ""
+        if ">" not in text:
+            # Common case: no blockquote lines to strip
+            return text.strip()
         lines = text.splitlines()
         cleaned_lines = [line for line in lines if not line.strip().startswith(">")]
         return "\n".join(cleaned_lines).strip()
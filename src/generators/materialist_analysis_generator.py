@@ -1,6 +1,7 @@
 import os
 import logging
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Tuple
 
 from interfaces import BaseGenerator
 from interfaces.models import MaterialistAnalyses, MaterialistAnalysisEntry
@@ -9,6 +10,7 @@ logger = logging.getLogger(__name__)
 
 # --- Configuration Constants ---
 MODEL_NAME = "Gemini-3-Pro"
+MAX_WORKERS = 8  # Concurrent region analyses (bounded by Poe rate limits)
 
 PROMPT_TEMPLATE = """
 You are **The Materialist Analyst**. Your goal is to analyze the provided text (news reports, transcripts, intelligence briefs) and strip away the "Breaking News" sensation, diplomatic rhetoric, and moral posturing.
@@ -46,6 +48,9 @@ Organize your analysis into the following four specific sections. For each secti
 {content}
 """
 
+# Halves of the template around its single {content} slot
+_PROMPT_PRE, _PROMPT_POST = PROMPT_TEMPLATE.split("{content}")
+
 
 class MaterialistAnalysisGenerator(BaseGenerator):
     """
@@ -68,8 +73,9 @@ class MaterialistAnalysisGenerator(BaseGenerator):
 
         entries: List[MaterialistAnalysisEntry] = []
 
-        # Get all markdown files in the directory
-        files = [f for f in os.listdir(input_dir) if f.endswith(".md")]
+        # Get all markdown files in the directory (DirEntry caches the file type)
+        with os.scandir(input_dir) as it:
+            files = [e for e in it if e.name.endswith(".md") and e.is_file()]
 
         if not files:
             logger.warning(f"No summary files found in {input_dir}")
@@ -77,53 +83,74 @@ class MaterialistAnalysisGenerator(BaseGenerator):
 
         logger.info(f"Starting Materialist Analysis for {len(files)} regions...")
 
-        for filename in files:
-            file_path = os.path.join(input_dir, filename)
+        # 1. Read files and extract region names (cheap, local)
+        regions = []
+        for entry in files:
+            filename = entry.name
 
             try:
-                with open(file_path, encoding="utf-8") as f:
-                    content = f.read()
-
-                # 1. Extract Region Name (First line starting with #)
-                region_name = self._extract_region_name(content)
+                # Extract Region Name (First line starting with #) and body
+                region_name, content = self._extract_region_name_from_path(entry.path)
                 if not region_name:
                     logger.warning(
                         f"Could not extract region name from {filename}. Skipping."
                     )
                     continue
 
-                # 2. Generate Analysis
+                regions.append((filename, region_name, content))
+
+            except Exception as e:
+                logger.error(f"Failed to analyze file {filename}: {e}")
+                continue
+
+        if not regions:
+            return MaterialistAnalyses(entries=[])
+
+        # 2. Generate Analyses concurrently (each call is network-bound)
+        with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(regions))) as executor:
+            futures = []
+            for filename, region_name, content in regions:
                 logger.info(f"Analyzing Region: {region_name} using {MODEL_NAME}")
-                analysis_text = self._query_llm(content)
+                futures.append(executor.submit(self._query_llm, content))
+
+            # 3. Store Results in file order
+            for (filename, region_name, _), future in zip(regions, futures):
+                try:
+                    analysis_text = future.result()
+                except Exception as e:
+                    logger.error(f"Failed to analyze file {filename}: {e}")
+                    continue
 
-                # 3. Store Result
                 entries.append(
                     MaterialistAnalysisEntry(region=region_name, analysis=analysis_text)
                 )
 
-            except Exception as e:
-                logger.error(f"Failed to analyze file {filename}: {e}")
-                continue
-
         return MaterialistAnalyses(entries=entries)
 
-    def _extract_region_name(self, content: str) -> str:
+    def _extract_region_name_from_path(self, file_path: str) -> Tuple[str, str]:
         """
-        Parses the markdown content to find the first H1 header.
-        Example Input: "# Southeast Asia\n..." -> Returns: "Southeast Asia"
+        Reads a summary file once, scanning line by line for the first H1 header
+        instead of splitting the whole body.
+        Example Input: "# Southeast Asia\n..." -> Returns: ("Southeast Asia", <full content>)
         """
-        for line in content.splitlines():
-            if line.startswith("# "):
-                return line.replace("# ", "").strip()
-        return "Unknown Region"
+        region_name = "Unknown Region"
+        head = []
+        with open(file_path, encoding="utf-8") as f:
+            for line in f:
+                head.append(line)
+                if line.startswith("# "):
+                    region_name = line.replace("# ", "").strip()
+                    break
+            # The rest of the body is needed for the analysis prompt
+            head.append(f.read())
+        return region_name, "".join(head)
 
     def _query_llm(self, summary_content: str) -> str:
         """
         Constructs the prompt and calls the LLM client.
         """
         # Inject the content into the template
-        prompt = PROMPT_TEMPLATE.format(content=summary_content)
+        prompt = _PROMPT_PRE + summary_content + _PROMPT_POST
 
-        # Use the injected LLM client with the specific provider and model
-        #
-        return self.llm_client.query(prompt, provider="poe", model=MODEL_NAME)
+        # Identical summaries (e.g. re-running Phase 4) reuse the cached analysis
+        return self._cached_query(prompt, provider="poe", model=MODEL_NAME)
@@ -1,5 +1,12 @@
+import hashlib
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Optional
+
+from managers.cache_manager import CacheManager
+
+# LLM responses are reused across runs for identical prompts
+RESPONSE_CACHE_NAMESPACE = "llm_responses"
+RESPONSE_CACHE_TTL_SECONDS = 30 * 24 * 60 * 60
 
 
 class BaseGenerator(ABC):
@@ -8,8 +15,15 @@ class BaseGenerator(ABC):
     (e.g., summarization, categorization).
     """
 
-    def __init__(self, llm_client: Any):
+    def __init__(self, llm_client: Any, response_cache: Optional[CacheManager] = None):
         self.llm_client = llm_client
+        self.response_cache: Optional[CacheManager] = None
+        # A client with its own response cache already answers repeats from disk;
+        # a second layer here would only duplicate every write
+        if getattr(llm_client, "response_cache", None) is None:
+            self.response_cache = response_cache or CacheManager(
+                RESPONSE_CACHE_NAMESPACE, ttl_seconds=RESPONSE_CACHE_TTL_SECONDS
+            )
 
     @abstractmethod
     def generate(self, input_data: Any) -> Any:
@@ -17,3 +31,25 @@ class BaseGenerator(ABC):
         Transforms input data into a new format via an LLM call.
         """
         pass
+
+    def _response_key(self, prompt: str, model: str) -> str:
+        """Cache key for a prompt/model pair (the prompt itself is not stored)."""
+        return hashlib.blake2b((model + "\x00" + prompt).encode("utf-8")).hexdigest()
+
+    def _cached_query(self, prompt: str, provider: str, model: str) -> str:
+        """
+        Returns the cached response for this prompt/model, querying the LLM only
+        on a miss. Empty responses are not cached.
+        """
+        if self.response_cache is None:
+            return self.llm_client.query(prompt, provider=provider, model=model)
+
+        key = self._response_key(prompt, model)
+        response = self.response_cache.get(key)
+        if response is not None:
+            return response
+
+        response = self.llm_client.query(prompt, provider=provider, model=model)
+        if response:
+            self.response_cache.set(key, response)
+        return response
@@ -1,9 +1,10 @@
 from dataclasses import dataclass, field
 from datetime import datetime
+from enum import Enum
 from typing import List, Optional, Dict, Any
 
 
-@dataclass
+@dataclass(slots=True)
 class ReportArtifact:
     """
     Represents a generated file ready to be saved to disk.
@@ -14,7 +15,17 @@ class ReportArtifact:
     filename: str
 
 
-@dataclass
+class SourceType(str, Enum):
+    """
+    Format of a Mainstream 'datapoint' source.
+    A str subclass, so members compare equal to and serialize as their plain values.
+    """
+
+    YOUTUBE = "youtube"
+    WEBPAGE = "webpage"
+
+
+@dataclass(slots=True)
 class MainstreamSourceEntry:
     """
     Represents a chunk of data from a Mainstream 'datapoint' source.
@@ -22,10 +33,10 @@ class MainstreamSourceEntry:
 
     source_name: str
     content: List[str]  # Flexible: ["Title 1", "Title 2"] OR ["Full scraped text..."]
-    source_type: str  # 'youtube' or 'webpage'
+    source_type: SourceType
 
 
-@dataclass
+@dataclass(slots=True)
 class MainstreamHeadlines:
     """
     Container for all mainstream source entries.
@@ -34,7 +45,7 @@ class MainstreamHeadlines:
     entries: List[MainstreamSourceEntry]
 
 
-@dataclass
+@dataclass(slots=True)
 class SourceHeadlines:
     """
     Helper class: Contains all titles from a single source, maintaining rank order.
@@ -45,7 +56,7 @@ class SourceHeadlines:
     titles: List[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalysisHeadlines:
     """
     Consolidated view of analysis articles.
@@ -55,7 +66,7 @@ class AnalysisHeadlines:
     source_groups: List[SourceHeadlines]
 
 
-@dataclass
+@dataclass(slots=True)
 class MaterialistAnalysisEntry:
     """
     Holds the generated analysis for a specific region.
@@ -65,7 +76,7 @@ class MaterialistAnalysisEntry:
     analysis: str
 
 
-@dataclass
+@dataclass(slots=True)
 class MaterialistAnalyses:
     """
     Container for all regional analyses generated in Phase 4.
@@ -74,7 +85,7 @@ class MaterialistAnalyses:
     entries: List[MaterialistAnalysisEntry]
 
 
-@dataclass
+@dataclass(slots=True)
 class GeopoliticalLedger:
     """
     Holds the output of the Geopolitical Ledger Generator.
@@ -86,7 +97,7 @@ class GeopoliticalLedger:
     ledger_content: str  # The full markdown table + title generated by the LLM
 
 
-@dataclass
+@dataclass(slots=True)
 class Article:
     """
     The core unit of information in the pipeline.
@@ -112,7 +123,7 @@ class Article:
         return self.summary is not None
 
 
-@dataclass
+@dataclass(slots=True)
 class RegionalBriefingEntry:
     """
     A single synthesized region.
@@ -124,7 +135,7 @@ class RegionalBriefingEntry:
     strategic_analysis: str  # The materialist/strategic reality
 
 
-@dataclass
+@dataclass(slots=True)
 class GlobalBriefing:
     """
     The final output of Phase 5.
@@ -134,7 +145,7 @@ class GlobalBriefing:
     date: datetime = field(default_factory=datetime.now)
 
 
-@dataclass
+@dataclass(slots=True)
 class LensAnalysis:
     """
     A single perspective on a region (e.g., 'The Realist' view).
@@ -144,7 +155,7 @@ class LensAnalysis:
     analysis_text: str
 
 
-@dataclass
+@dataclass(slots=True)
 class MultiLensRegionEntry:
     """
     Container for all 9 perspectives on a specific region.
@@ -154,7 +165,7 @@ class MultiLensRegionEntry:
     lenses: List[LensAnalysis]
 
 
-@dataclass
+@dataclass(slots=True)
 class MultiLensAnalysis:
     """
     The final output of Phase 6.
@@ -165,7 +176,7 @@ class MultiLensAnalysis:
     date: datetime = field(default_factory=datetime.now)
 
 
-@dataclass
+@dataclass(slots=True)
 class MainstreamEventEntry:
     """
     A unified summary of mainstream reporting for a specific region.
@@ -176,7 +187,7 @@ class MainstreamEventEntry:
     summary_text: str
 
 
-@dataclass
+@dataclass(slots=True)
 class MainstreamNarrative:
     """
     The output of the MainstreamNewsSynthesizer.
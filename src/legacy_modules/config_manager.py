@@ -1,8 +1,17 @@
 # Legacy module: retained for compatibility and slated for migration or deprecation.
 
+import copy
 import yaml
 import os
 import logging
+from typing import Dict, Tuple
+
+# libyaml-backed loader when PyYAML was built with it; same safe semantics either way
+SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Parsed configs shared across instances, keyed by (absolute path, mtime_ns, size)
+# so an edited file is simply re-parsed under a new key.
+_PARSE_CACHE: Dict[Tuple[str, int, int], dict] = {}
 
 
 class ConfigManager:
@@ -25,13 +34,21 @@ class ConfigManager:
         self.data = self._load_config()
 
     def _load_config(self) -> dict:
+        stat = os.stat(self.config_path)
+        key = (os.path.abspath(self.config_path), stat.st_mtime_ns, stat.st_size)
+        if key in _PARSE_CACHE:
+            logging.info(f"Reusing parsed configuration for '{self.config_path}'")
+            # Each instance gets its own copy, so callers can't mutate the cache
+            return copy.deepcopy(_PARSE_CACHE[key])
+
         try:
             with open(self.config_path) as file:
-                config_data = yaml.safe_load(file)
+                config_data = yaml.load(file, Loader=SafeLoader)
                 logging.info(
                     f"Successfully loaded and parsed configuration from '{self.config_path}'"
                 )
-                return config_data
+                _PARSE_CACHE[key] = config_data
+                return copy.deepcopy(config_data)
         except yaml.YAMLError as e:
             # Handle potential errors during YAML parsing
             logging.error(f"Error parsing YAML file '{self.config_path}': {e}")
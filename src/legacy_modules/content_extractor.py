@@ -1,11 +1,27 @@
 # Legacy module: retained for compatibility and slated for migration or deprecation.
 
+import atexit
+import functools
 import logging
+import queue
 import re
+import threading
 import time
-from urllib.parse import urlparse, parse_qs
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Optional
+from urllib.parse import urlparse
 
+import requests
 from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    # Optional C-backed (lexbor) HTML parser; BeautifulSoup is the fallback.
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
 from selenium import webdriver
 from selenium.common.exceptions import WebDriverException
 from selenium.webdriver.firefox.options import Options as FirefoxOptions
@@ -21,9 +37,157 @@ from youtube_transcript_api import (
 
 from legacy_modules.youtube_transcript_api_handler import YoutubeTranscriptApiHandler
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# JSON endpoint behind Tactiq's "Get Video Transcript" form. Calling it directly
+# avoids driving a browser; the Selenium flow remains as a fallback.
+TACTIQ_TRANSCRIPT_ENDPOINT = "https://tactiq-apps-prod.tactiq.io/transcript"
+
+# Default timeout (seconds) for direct HTTP calls made through _SESSION
+HTTP_TIMEOUT = 30
+
+# Shared by the plain-HTTP fetch and the Selenium browser
+BROWSER_USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:109.0) Gecko/20100101 Firefox/115.0"
+)
+
+# Plain-HTTP page fetches: timeout, and the minimum cleaned text length accepted
+# before falling back to a real browser (JS-only shells fall well below this).
+STATIC_FETCH_TIMEOUT = 10
+MIN_STATIC_CONTENT_LENGTH = 500
+
+
+def _build_session() -> requests.Session:
+    """
+    Shared keep-alive Session for all direct HTTP work in this module.
+    Transient failures (connection errors, 429/5xx) are retried with backoff
+    on pooled connections. POST is included because the Tactiq lookup is idempotent.
+    """
+    retry = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=frozenset(["GET", "POST"]),
+    )
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=50, max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+_SESSION = _build_session()
+
+
+def _build_probe_session() -> requests.Session:
+    """
+    Pooled Session for the plain-HTTP page probe. It never retries: any
+    failure should fall through to Selenium at once, not after several
+    backed-off STATIC_FETCH_TIMEOUT waits.
+    """
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=50, max_retries=Retry(0))
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+_PROBE_SESSION = _build_probe_session()
+
+# Non-content elements stripped before extracting page text
+_NON_CONTENT_TAGS = ("script", "style", "noscript", "header", "footer", "nav", "aside")
+_WS_RE = re.compile(r"\s+")
+
+# YouTube video ID from watch?v=, /shorts/, /embed/ and youtu.be/ URLs
+_VIDEO_ID_RE = re.compile(
+    # Scheme and host are case-insensitive (as urlparse().hostname was); paths are not
+    r"^(?i:(?:https?://)?(?:(?:www|m)\.)?)"
+    r"(?:(?i:youtube\.com)/(?:watch\?(?:[^#]*&)?v=|shorts/|embed/)|(?i:youtu\.be)/)"
+    r"([A-Za-z0-9_-]{11})(?![A-Za-z0-9_-])"
+)
+
+# Transcript languages to accept from the free API, in priority order
+TRANSCRIPT_LANGUAGES = ("en", "en-US", "en-GB")
+
+# Tactiq prefixes each caption line with an HH:MM:SS.mmm timestamp
+_TIMESTAMP_RE = re.compile(r"\d{2}:\d{2}:\d{2}\.\d{3}\s*")
+
+
+class _DriverPool:
+    """
+    Keeps idle WebDrivers around for reuse so each extraction doesn't pay the
+    multi-second Firefox/geckodriver startup. Drivers are created on demand;
+    at most `max_idle` are kept between calls, extras are quit on release.
+    """
+
+    def __init__(self, factory, max_idle: int = 4):
+        self._factory = factory
+        self._idle = queue.LifoQueue(maxsize=max_idle)
+
+    def acquire(self):
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            return self._factory()
+
+    def release(self, driver):
+        """Resets a healthy driver and returns it to the pool."""
+        try:
+            driver.delete_all_cookies()
+            driver.get("about:blank")
+            self._idle.put_nowait(driver)
+        except queue.Full:
+            self.discard(driver)
+        except Exception as e:
+            logger.warning("Discarding WebDriver that failed to reset: %s", e)
+            self.discard(driver)
+
+    def discard(self, driver):
+        """Quits a driver that should not be reused (e.g. after an error)."""
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def close_all(self):
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            self.discard(driver)
+
+
+def _init_driver(headless: bool):
+    """Initializes and returns a fresh Firefox WebDriver. Callers go through a _DriverPool."""
+    options = FirefoxOptions()
+    if headless:
+        options.add_argument("--headless")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument(f"user-agent={BROWSER_USER_AGENT}")
+    try:
+        logger.info("Initializing Firefox WebDriver...")  # Logging
+        driver = webdriver.Firefox(options=options)
+        return driver
+    except WebDriverException as e:
+        logger.error("Failed to initialize Firefox WebDriver: %s", e)
+        raise
+
+
+# Reused Firefox instances for the Selenium tiers, shared by every extractor
+# (one pool per headless mode) and quit by a single exit hook
+_DRIVER_POOLS = {
+    headless: _DriverPool(functools.partial(_init_driver, headless))
+    for headless in (True, False)
+}
+
+
+@atexit.register
+def _close_driver_pools():
+    for pool in _DRIVER_POOLS.values():
+        pool.close_all()
+
 
 class ContentExtractor:
     """
@@ -36,52 +200,53 @@ class ContentExtractor:
         self.headless = headless
         self.max_retries = 2
         self.retry_delays = [2, 2]
+        # Head start (seconds) given to the Free API before Tactiq is launched alongside it
+        self.tactiq_launch_delay = 1.0
 
         # Load Paid API Key
         self.paid_api_key = self.config.get("api_keys", {}).get(
             "youtube_transcript_api"
         )
 
-    def _init_driver(self):
-        """Initializes and returns a fresh Firefox WebDriver."""
-        options = FirefoxOptions()
-        if self.headless:
-            options.add_argument("--headless")
-        options.add_argument("--no-sandbox")
-        options.add_argument("--disable-dev-shm-usage")
-        options.add_argument(
-            "user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:109.0) Gecko/20100101 Firefox/115.0"
-        )
-        try:
-            logger.info("Initializing Firefox WebDriver...")  # Logging
-            driver = webdriver.Firefox(options=options)
-            return driver
-        except WebDriverException as e:
-            logger.error(f"Failed to initialize Firefox WebDriver: {e}")
-            raise
+        # One transcript client per extractor so its HTTP session (and
+        # connections to youtube.com) are reused across videos
+        self._ytt_api = YouTubeTranscriptApi()
+
+        # Shared Firefox pool for the Selenium tiers (see _DRIVER_POOLS)
+        self._driver_pool = _DRIVER_POOLS[bool(headless)]
+
+    def close(self):
+        """
+        Quits the idle WebDrivers in the shared pool. The extractor (and any
+        other) can still be used afterwards; drivers are started on demand.
+        """
+        self._driver_pool.close_all()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
 
     def _clean_html_content(self, html_content: str) -> str:
         logger.info("Cleaning HTML content...")  # Logging
-        soup = BeautifulSoup(html_content, "html.parser")
-        for script_or_style in soup(
-            ["script", "style", "noscript", "header", "footer", "nav", "aside"]
-        ):
-            script_or_style.decompose()
-        text = soup.get_text(separator=" ", strip=True)
-        text = re.sub(r"\s+", " ", text)
+        if LexborHTMLParser is not None:
+            tree = LexborHTMLParser(html_content)
+            for node in tree.css(", ".join(_NON_CONTENT_TAGS)):
+                node.decompose()
+            text = tree.root.text(separator=" ", strip=True) if tree.root else ""
+        else:
+            soup = BeautifulSoup(html_content, "html.parser")
+            for script_or_style in soup(list(_NON_CONTENT_TAGS)):
+                script_or_style.decompose()
+            text = soup.get_text(separator=" ", strip=True)
+        text = _WS_RE.sub(" ", text)
         return text.strip()
 
-    def _get_video_id(self, url: str) -> str:
-        logger.info(f"Extracting video ID from URL: {url}")
-        parsed = urlparse(url)
-        if parsed.hostname in ["www.youtube.com", "youtube.com"]:
-            if parsed.path == "/watch":
-                return parse_qs(parsed.query).get("v", [None])[0]
-            elif parsed.path.startswith("/shorts/"):
-                return parsed.path.split("/")[-1]
-        elif parsed.hostname == "youtu.be":
-            return parsed.path.split("/")[-1]
-        return None
+    def _get_video_id(self, url: str) -> Optional[str]:
+        logger.info("Extracting video ID from URL: %s", url)
+        match = _VIDEO_ID_RE.match(url)
+        return match.group(1) if match else None
 
     def _extract_transcript_paid_youtube_api(self, youtube_url: str) -> str:
         """
@@ -95,18 +260,21 @@ class ContentExtractor:
 
         video_id = self._get_video_id(youtube_url)
         if not video_id:
-            logger.warning(f"Could not determine Video ID for Paid API: {youtube_url}")
+            logger.warning("Could not determine Video ID for Paid API: %s", youtube_url)
             return ""
 
         for attempt in range(self.max_retries + 1):
             try:
                 if attempt > 0:
                     logger.info(
-                        f"Paid API Retry {attempt + 1}/{self.max_retries + 1} for {video_id}..."
+                        "Paid API Retry %s/%s for %s...",
+                        attempt + 1,
+                        self.max_retries + 1,
+                        video_id,
                     )
                 else:
                     logger.info(
-                        f"Attempting Paid API extraction for Video ID: {video_id}"
+                        "Attempting Paid API extraction for Video ID: %s", video_id
                     )
 
                 # Instantiate the Handler (Request happens here)
@@ -126,13 +294,13 @@ class ContentExtractor:
 
             except Exception as e:
                 logger.warning(
-                    f"Paid API attempt {attempt + 1} failed for {video_id}: {e}"
+                    "Paid API attempt %s failed for %s: %s", attempt + 1, video_id, e
                 )
 
                 if attempt < self.max_retries:
                     time.sleep(self.retry_delays[attempt])
 
-        logger.error(f"All Paid API attempts failed for {video_id}.")
+        logger.error("All Paid API attempts failed for %s.", video_id)
         return ""
 
     def _extract_transcript_free_youtube_api(self, youtube_url: str) -> str:
@@ -142,32 +310,72 @@ class ContentExtractor:
             logger.info("No video ID found for Free API.")  # Logging
             return ""
 
-        logger.info(f"Attempting Free API extraction for Video ID: {video_id}")
+        logger.info("Attempting Free API extraction for Video ID: %s", video_id)
         try:
-            ytt_api = YouTubeTranscriptApi()
-            transcripts_snippets_list = ytt_api.fetch(video_id=video_id)
-            full_text = " ".join([t.text for t in transcripts_snippets_list])
+            transcripts_snippets_list = self._ytt_api.fetch(
+                video_id=video_id, languages=TRANSCRIPT_LANGUAGES
+            )
+            full_text = " ".join(t.text for t in transcripts_snippets_list)
             logger.info("Free API extraction successful.")
             return full_text
         except (TranscriptsDisabled, NoTranscriptFound):
-            logger.warning(f"Free API Transcript unavailable for {video_id}.")
+            logger.warning("Free API Transcript unavailable for %s.", video_id)
             return ""
         except Exception as e:
-            logger.error(f"Free API extraction error for {video_id}: {e}")
+            logger.error("Free API extraction error for %s: %s", video_id, e)
             return ""
 
-    def _extract_transcript_youtube_tactiq(self, youtube_url: str) -> str:
-        """Tier 2 Method: Extracts YouTube transcript using Tactiq via Selenium."""
-        logger.info(f"Starting Selenium/Tactiq fallback for: {youtube_url}")
+    def _extract_transcript_tactiq_http(self, youtube_url: str) -> str:
+        """Calls Tactiq's transcript endpoint directly. Returns "" on any failure."""
+        logger.info("Attempting Tactiq HTTP extraction for: %s", youtube_url)
+        try:
+            response = _SESSION.post(
+                TACTIQ_TRANSCRIPT_ENDPOINT,
+                json={"videoUrl": youtube_url, "langCode": "en"},
+                timeout=HTTP_TIMEOUT,
+            )
+            response.raise_for_status()
+            captions = response.json().get("captions") or []
+            text = " ".join(c.get("text", "") for c in captions)
+            cleaned_text = _TIMESTAMP_RE.sub("", text).strip()
+        except Exception as e:
+            logger.warning("Tactiq HTTP extraction failed: %s", e)
+            return ""
+
+        if cleaned_text:
+            logger.info("Tactiq HTTP extraction successful.")
+        return cleaned_text
+
+    def _extract_transcript_youtube_tactiq(
+        self, youtube_url: str, cancel: Optional[threading.Event] = None
+    ) -> str:
+        """
+        Tier 2 Method: Extracts YouTube transcript using Tactiq.
+        Tries the HTTP endpoint first, then drives the web form via Selenium.
+        Once `cancel` is set, no further browser attempt is started.
+        """
+        cancel = cancel or threading.Event()
+        cleaned_text = self._extract_transcript_tactiq_http(youtube_url)
+        if cleaned_text:
+            return cleaned_text
+
+        logger.info("Starting Selenium/Tactiq fallback for: %s", youtube_url)
         tactiq_base_url = "https://tactiq.io/tools/youtube-transcript"
 
         for attempt in range(self.max_retries + 1):
+            if cancel.is_set():
+                logger.info("Tactiq fallback cancelled for: %s", youtube_url)
+                return ""
+
             driver = None
+            healthy = False
             try:
                 if attempt > 0:
-                    logger.info(f"Tactiq Retry {attempt + 1}/{self.max_retries + 1}...")
+                    logger.info(
+                        "Tactiq Retry %s/%s...", attempt + 1, self.max_retries + 1
+                    )
 
-                driver = self._init_driver()
+                driver = self._driver_pool.acquire()
                 driver.get(tactiq_base_url)
 
                 url_input = WebDriverWait(driver, 20).until(
@@ -191,37 +399,81 @@ class ContentExtractor:
                 WebDriverWait(driver, 30).until(lambda d: container.text.strip() != "")
 
                 raw_text = container.text
-                cleaned_text = re.sub(
-                    r"\d{2}:\d{2}:\d{2}\.\d{3}\s*", "", raw_text
-                ).strip()
+                cleaned_text = _TIMESTAMP_RE.sub("", raw_text).strip()
 
+                healthy = True
                 if cleaned_text:
-                    logger.info(f"Tactiq extraction successful on attempt {attempt+1}")
+                    logger.info(
+                        "Tactiq extraction successful on attempt %s", attempt + 1
+                    )
                     return cleaned_text
 
             except Exception as e:
-                logger.warning(f"Tactiq attempt {attempt + 1} failed: {e}")
+                logger.warning("Tactiq attempt %s failed: %s", attempt + 1, e)
             finally:
                 if driver:
-                    driver.quit()
+                    # Only recycle drivers that completed the flow cleanly
+                    if healthy:
+                        self._driver_pool.release(driver)
+                    else:
+                        self._driver_pool.discard(driver)
 
             if attempt < self.max_retries:
-                time.sleep(self.retry_delays[attempt])
+                # Interruptible back-off, so a cancelled run exits promptly
+                cancel.wait(self.retry_delays[attempt])
 
         logger.error("All Tactiq attempts failed.")
         return ""
 
+    def _extract_webpage_content_static(self, url: str) -> str:
+        """
+        Fetches the page with a plain HTTP GET (no JavaScript).
+        Returns "" if the request fails or the page yields too little text.
+        """
+        try:
+            response = _PROBE_SESSION.get(
+                url,
+                headers={"User-Agent": BROWSER_USER_AGENT},
+                timeout=STATIC_FETCH_TIMEOUT,
+            )
+            response.raise_for_status()
+            if "html" not in response.headers.get("Content-Type", "html"):
+                return ""
+            cleaned_text = self._clean_html_content(response.text)
+        except Exception as e:
+            logger.info("Static fetch failed for %s: %s", url, e)
+            return ""
+
+        if len(cleaned_text) < MIN_STATIC_CONTENT_LENGTH:
+            logger.info(
+                "Static fetch for %s yielded %s characters; page likely needs JavaScript.",
+                url,
+                len(cleaned_text),
+            )
+            return ""
+
+        logger.info("Static webpage extraction successful for %s", url)
+        return cleaned_text
+
     def _extract_webpage_content(self, url: str) -> str:
-        """Extracts webpage content using Selenium + BS4."""
+        """
+        Extracts webpage content. Tries a plain HTTP fetch first and only
+        starts Selenium (+ HTML cleaning) when the page needs JavaScript.
+        """
+        cleaned_text = self._extract_webpage_content_static(url)
+        if cleaned_text:
+            return cleaned_text
+
         for attempt in range(self.max_retries + 1):
             driver = None
+            healthy = False
             try:
                 if attempt > 0:
                     logger.info(
-                        f"Webpage Retry {attempt + 1}/{self.max_retries + 1}..."
+                        "Webpage Retry %s/%s...", attempt + 1, self.max_retries + 1
                     )
 
-                driver = self._init_driver()
+                driver = self._driver_pool.acquire()
                 driver.get(url)
 
                 WebDriverWait(driver, 20).until(
@@ -229,28 +481,71 @@ class ContentExtractor:
                 )
 
                 html = driver.page_source
+                healthy = True
                 cleaned_text = self._clean_html_content(html)
 
                 if cleaned_text:
-                    logger.info(f"Webpage extraction successful on attempt {attempt+1}")
+                    logger.info(
+                        "Webpage extraction successful on attempt %s", attempt + 1
+                    )
                     return cleaned_text
 
             except Exception as e:
-                logger.warning(f"Webpage attempt {attempt + 1} failed: {e}")
+                logger.warning("Webpage attempt %s failed: %s", attempt + 1, e)
             finally:
                 if driver:
-                    driver.quit()
+                    if healthy:
+                        self._driver_pool.release(driver)
+                    else:
+                        self._driver_pool.discard(driver)
 
             if attempt < self.max_retries:
                 time.sleep(self.retry_delays[attempt])
         logger.error("All webpage extraction attempts failed.")
         return ""
 
+    def _race_free_api_and_tactiq(self, url: str) -> str:
+        """
+        Runs the Free API and Tactiq tiers speculatively and returns the first
+        non-empty transcript. The Free API gets a `tactiq_launch_delay` head start
+        so the cheap path wins the common case without starting a browser;
+        if it hasn't succeeded by then, Tactiq runs alongside it instead of after it.
+        """
+        executor = ThreadPoolExecutor(max_workers=2)
+        cancel_tactiq = threading.Event()
+        try:
+            pending = {executor.submit(self._extract_transcript_free_youtube_api, url)}
+            done, pending = wait(pending, timeout=self.tactiq_launch_delay)
+            for future in done:
+                content = future.result()
+                if content:
+                    return content
+
+            logger.info("Free API yielded no result yet. Starting Tactiq fallback...")
+            pending.add(
+                executor.submit(
+                    self._extract_transcript_youtube_tactiq, url, cancel_tactiq
+                )
+            )
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    content = future.result()
+                    if content:
+                        return content
+
+            return ""
+        finally:
+            # Don't block on the slower tier once we have an answer; a running
+            # Tactiq call stops before its next browser attempt
+            cancel_tactiq.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+
     def get_text(self, url: str) -> str:
         """
-        Public Router. Order: Paid API -> Free API -> Selenium.
+        Public Router. Order: Paid API -> (Free API raced with Tactiq) / Selenium.
         """
-        logger.info(f"Starting content extraction for URL: {url}")
+        logger.info("Starting content extraction for URL: %s", url)
         parsed = urlparse(url)
         is_youtube = "youtube.com" in parsed.hostname or "youtu.be" in parsed.hostname
 
@@ -260,14 +555,8 @@ class ContentExtractor:
             if content:
                 return content
 
-            # 2. Tier 1: Free API
+            # 2./3. Tier 1 (Free API) and Tier 2 (Tactiq), raced
             logger.info("Paid API yielded no result. Trying Free API...")
-            content = self._extract_transcript_free_youtube_api(url)
-            if content:
-                return content
-
-            # 3. Tier 2: Selenium Fallback
-            logger.info("Free API yielded no result. Switching to Tactiq fallback...")
-            return self._extract_transcript_youtube_tactiq(url)
+            return self._race_free_api_and_tactiq(url)
         else:
             return self._extract_webpage_content(url)
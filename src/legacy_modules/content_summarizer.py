@@ -1,17 +1,30 @@
 # Legacy module: retained for compatibility and slated for migration or deprecation.
 
+import asyncio
+import hashlib
 import logging
+import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
 from legacy_modules.content_extractor import ContentExtractor
 from legacy_modules.llm_client import LLMClient
+from managers.cache_manager import CacheManager
 
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
-)
 logger = logging.getLogger(__name__)
 
 MINIMUM_CONTENT_LENGTH = 150
 
+# Longer content is cut before prompting; the summary is a few hundred words,
+# so the tail mostly costs upload bytes and input tokens.
+MAX_CONTENT_CHARS = 40000
+
+# Summary cache policy: entries younger than FRESH are served as-is; older ones
+# (up to MAX_AGE) are served immediately and refreshed in the background.
+SUMMARY_CACHE_FRESH_SECONDS = 7 * 24 * 60 * 60
+SUMMARY_CACHE_MAX_AGE_SECONDS = 30 * 24 * 60 * 60
+
 SUMMARY_PROMPT_TEMPLATE = """
 **Role:** You are an elite Intelligence Analyst processing raw source documents for a high-level decision-maker.
 
@@ -41,11 +54,20 @@ SUMMARY_PROMPT_TEMPLATE = """
 {content}
 """
 
+# Split once at import; building the prompt is then a plain concatenation.
+_PROMPT_PRE, _PROMPT_POST = SUMMARY_PROMPT_TEMPLATE.split("{content}")
+
+# A whole line (plus its newline) whose first non-blank character is '>'
+_BLOCKQUOTE_RE = re.compile(r"^[^\S\n]*>[^\n]*\n?", re.MULTILINE)
+
 
 class ContentSummarizer:
     """
     Summarizes content using an LLM via the unified LLMClient.
     Delegates text extraction to ContentExtractor with robust retry logic.
+
+    Browser instances are reused across calls; use `with ContentSummarizer(...) as s:`
+    (or call close()) to shut them down when a batch is finished.
     """
 
     def __init__(self, config: dict, model: str = "Gemini-2.5-Flash"):
@@ -63,23 +85,102 @@ class ContentSummarizer:
         # Initialize Unified LLM Client
         self.llm_client = LLMClient(config)
 
+        # Persistent summary cache (keyed by model + prompt hash)
+        self._summary_cache = CacheManager(
+            "summaries", ttl_seconds=SUMMARY_CACHE_MAX_AGE_SECONDS
+        )
+        self._refresh_executor = None
+        self._refreshing = set()
+        self._refresh_lock = threading.Lock()
+
+    def close(self):
+        """
+        Releases the browser instances held by the extractor and waits for any
+        background summary refreshes to finish.
+        """
+        self.extractor.close()
+        with self._refresh_lock:
+            executor, self._refresh_executor = self._refresh_executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
     def _clean_llm_output(self, llm_response_text: str) -> str:
         """Removes meta-commentary and 'thinking' lines from the LLM output."""
         if not llm_response_text:
             return ""
 
-        lines = llm_response_text.splitlines()
         # Filter out blockquotes often used for "Chain of Thought"
-        cleaned_lines = [line for line in lines if not line.strip().startswith(">")]
-        return "\n".join(cleaned_lines).strip()
+        return _BLOCKQUOTE_RE.sub("", llm_response_text).strip()
+
+    def _cache_key(self, prompt: str) -> str:
+        return hashlib.sha256(f"{self.model}\n{prompt}".encode("utf-8")).hexdigest()
+
+    def _get_cached_summary(self, cache_key: str, prompt: str) -> Optional[str]:
+        """Returns a cached summary if present, scheduling a refresh when it is stale."""
+        summary, age = self._summary_cache.get_with_age(cache_key)
+        if summary is None:
+            return None
+
+        if age > SUMMARY_CACHE_FRESH_SECONDS:
+            logger.info("Serving stale cached summary; refreshing in background.")
+            self._schedule_refresh(cache_key, prompt)
+        else:
+            logger.info("Serving cached summary.")
+        return summary
+
+    def _schedule_refresh(self, cache_key: str, prompt: str) -> None:
+        with self._refresh_lock:
+            if cache_key in self._refreshing:
+                return
+            self._refreshing.add(cache_key)
+            if self._refresh_executor is None:
+                self._refresh_executor = ThreadPoolExecutor(max_workers=2)
+        self._refresh_executor.submit(self._refresh_summary, cache_key, prompt)
+
+    def _refresh_summary(self, cache_key: str, prompt: str) -> None:
+        try:
+            raw_summary = self.llm_client.query(
+                prompt=prompt, provider="poe", model=self.model
+            )
+            cleaned_summary = self._clean_llm_output(raw_summary)
+            if cleaned_summary:
+                self._summary_cache.set(cache_key, cleaned_summary)
+                logger.info("Background summary refresh complete.")
+        except Exception as e:
+            logger.warning("Background summary refresh failed: %s", e)
+        finally:
+            with self._refresh_lock:
+                self._refreshing.discard(cache_key)
+
+    def _truncate_content(self, content: str) -> str:
+        if len(content) <= MAX_CONTENT_CHARS:
+            return content
+        logger.info(
+            "Truncating content from %s to %s characters.",
+            len(content),
+            MAX_CONTENT_CHARS,
+        )
+        return content[:MAX_CONTENT_CHARS] + "\n...[truncated]"
 
     def _summarize_text(self, content: str) -> str:
         """Sends content to the LLMClient for summarization."""
         if not content or len(content) < MINIMUM_CONTENT_LENGTH:
             return "Error: Not enough content to generate a meaningful summary."
 
-        logger.info(f"Sending {len(content)} characters to LLM for summarization...")
-        prompt = SUMMARY_PROMPT_TEMPLATE.format(content=content)
+        content = self._truncate_content(content)
+        logger.info("Sending %s characters to LLM for summarization...", len(content))
+        prompt = _PROMPT_PRE + content + _PROMPT_POST
+
+        cache_key = self._cache_key(prompt)
+        cached_summary = self._get_cached_summary(cache_key, prompt)
+        if cached_summary is not None:
+            return cached_summary
 
         try:
             start_time = time.monotonic()
@@ -92,19 +193,21 @@ class ContentSummarizer:
             )
 
             cleaned_summary = self._clean_llm_output(raw_summary)
+            if cleaned_summary:
+                self._summary_cache.set(cache_key, cleaned_summary)
 
             duration = time.monotonic() - start_time
-            logger.info(f"Summarization successful. Time: {duration:.2f}s.")
+            logger.info("Summarization successful. Time: %.2fs.", duration)
             return cleaned_summary
         except Exception as e:
-            logger.error(f"Summarization failed: {e}")
+            logger.error("Summarization failed: %s", e)
             return f"Error: Failed to generate summary: {e}"
 
     def summarize(self, source_name: str, url: str) -> str:
         """
         Public method to orchestrate content fetching and summarization.
         """
-        logger.info(f"--- Processing: '{source_name}': {url} ---")
+        logger.info("--- Processing: '%s': %s ---", source_name, url)
 
         try:
             # 1. Fetch Content (Extractor handles retries internally)
@@ -124,5 +227,93 @@ class ContentSummarizer:
             return self._summarize_text(content)
 
         except Exception as e:
-            logger.error(f"Critical error in summarize workflow for {url}: {e}")
+            logger.error("Critical error in summarize workflow for %s: %s", url, e)
             return f"Error: {e}"
+
+    async def _summarize_text_async(self, content: str) -> str:
+        """Async counterpart of _summarize_text."""
+        if not content or len(content) < MINIMUM_CONTENT_LENGTH:
+            return "Error: Not enough content to generate a meaningful summary."
+
+        content = self._truncate_content(content)
+        logger.info("Sending %s characters to LLM for summarization...", len(content))
+        prompt = _PROMPT_PRE + content + _PROMPT_POST
+
+        cache_key = self._cache_key(prompt)
+        cached_summary = self._get_cached_summary(cache_key, prompt)
+        if cached_summary is not None:
+            return cached_summary
+
+        try:
+            start_time = time.monotonic()
+
+            raw_summary = await self.llm_client.query_async(
+                prompt=prompt,
+                provider="poe",
+                model=self.model,
+            )
+
+            cleaned_summary = self._clean_llm_output(raw_summary)
+            if cleaned_summary:
+                self._summary_cache.set(cache_key, cleaned_summary)
+
+            duration = time.monotonic() - start_time
+            logger.info("Summarization successful. Time: %.2fs.", duration)
+            return cleaned_summary
+        except Exception as e:
+            logger.error("Summarization failed: %s", e)
+            return f"Error: Failed to generate summary: {e}"
+
+    async def _summarize_async(
+        self, source_name: str, url: str, semaphore: asyncio.Semaphore
+    ) -> str:
+        """Async counterpart of summarize(), bounded by a shared semaphore."""
+        async with semaphore:
+            logger.info("--- Processing: '%s': %s ---", source_name, url)
+
+            try:
+                # Extraction is blocking (HTTP/Selenium), so run it off the event loop
+                content = await asyncio.to_thread(self.extractor.get_text, url)
+
+                if (
+                    not content
+                    or len(content) < MINIMUM_CONTENT_LENGTH
+                    or content.startswith("[Error")
+                ):
+                    error_msg = f"Failed to extract usable content from {url}."
+                    logger.error(error_msg)
+                    return f"Error: {error_msg}"
+
+                return await self._summarize_text_async(content)
+
+            except Exception as e:
+                logger.error("Critical error in summarize workflow for %s: %s", url, e)
+                return f"Error: {e}"
+
+    async def summarize_many(
+        self, items: List[Tuple[str, str]], max_concurrency: int = 8
+    ) -> List[str]:
+        """
+        Summarizes several sources concurrently so their LLM calls overlap.
+        Sync callers can use asyncio.run(summarizer.summarize_many(items)).
+
+        Args:
+            items (List[Tuple[str, str]]): (source_name, url) pairs.
+            max_concurrency (int): Maximum number of sources processed at once.
+
+        Returns:
+            List[str]: One summary (or "Error: ..." string) per item, in input order.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        try:
+            results = await asyncio.gather(
+                *(self._summarize_async(name, url, semaphore) for name, url in items),
+                return_exceptions=True,
+            )
+        finally:
+            # Pooled connections belong to this event loop; release them with it
+            await self.llm_client.aclose()
+        return [
+            f"Error: {result}" if isinstance(result, BaseException) else result
+            for result in results
+        ]
@@ -1,12 +1,20 @@
 # Legacy module: retained for compatibility and slated for migration or deprecation.
 
 import os
+import importlib.util
 import pandas as pd
 import logging
 from typing import List, Dict, Any
 
 logger = logging.getLogger(__name__)
 
+# Use Arrow's multi-threaded C++ CSV reader when pyarrow is installed.
+_CSV_ENGINE = "pyarrow" if importlib.util.find_spec("pyarrow") else None
+
+# Arrow infers timestamps that pandas' default parser leaves as text; pin them
+# so either engine yields the same frame (and the same re-written CSVs).
+_PINNED_DTYPES = {"collected_at": str}
+
 
 class CSVHandler:
     """
@@ -35,6 +43,14 @@ class CSVHandler:
             logger.error(f"Failed to append records to CSV: {e}")
             raise
 
+    @staticmethod
+    def save_dataframe(df: pd.DataFrame, filepath: str) -> None:
+        """
+        Writes the DataFrame to a CSV file, replacing any existing file.
+        Always uses pandas, so the files are identical with or without pyarrow.
+        """
+        df.to_csv(filepath, index=False)
+
     @staticmethod
     def load_as_dataframe(filepath: str) -> pd.DataFrame:
         """
@@ -44,7 +60,16 @@ class CSVHandler:
             return pd.DataFrame()
 
         try:
-            return pd.read_csv(filepath)
+            if _CSV_ENGINE:
+                try:
+                    return pd.read_csv(
+                        filepath, engine=_CSV_ENGINE, dtype=_PINNED_DTYPES
+                    )
+                except Exception as e:
+                    logger.debug(
+                        f"{_CSV_ENGINE} engine failed on {filepath}, retrying with default parser: {e}"
+                    )
+            return pd.read_csv(filepath, dtype=_PINNED_DTYPES)
         except Exception as e:
             logger.error(f"Failed to read CSV from {filepath}: {e}")
             return pd.DataFrame()
@@ -4,7 +4,6 @@ import logging
 import os
 import re
 from datetime import datetime
-import pandas as pd
 
 # --- Import Custom Modules ---
 from legacy_modules.headline_synthesizer import HeadlineSynthesizer
@@ -13,6 +12,7 @@ from legacy_modules.link_collector import LinkCollector
 from legacy_modules.title_fetcher import TitleFetcher
 from legacy_modules.region_categoriser import RegionCategoriser
 from legacy_modules.markdown_generator import MarkdownGenerator
+from legacy_modules.csv_handler import CSVHandler
 
 
 class GlobalNewsAggregator:
@@ -26,6 +26,10 @@ class GlobalNewsAggregator:
         # Default Output Directory from config or fallback
         self.output_dir = self.config.get("output_directory", "../outputs/")
 
+        # One timestamp per run, so every phase agrees on the date
+        self.run_datetime = datetime.now()
+        self.run_date_str = self.run_datetime.strftime("%Y-%m-%d")
+
     def _sanitize_filename(self, name: str) -> str:
         """Removes spaces and special characters to create a valid filename."""
         name = re.sub(r"[^\w\s-]", "", name)
@@ -70,12 +74,12 @@ class GlobalNewsAggregator:
                 f"Processing {len(datapoint_sources)} 'datapoint' sources."
             )
 
-            # Process Sources
+            # Process Sources (channels are fetched concurrently, in config order)
+            summaries = headline_synthesizer.synthesize_many(datapoint_sources)
             markdown_results = []
-            for source in datapoint_sources:
+            for source, summary in zip(datapoint_sources, summaries):
                 channel_name = source.get("name")
-                self.logger.info(f"Processing Channel: {channel_name}")
-                summary = headline_synthesizer.synthesize_channel_activity(source)
+                self.logger.info(f"Processed Channel: {channel_name}")
                 result_block = f"## {channel_name} ({source.get('url')})\n{summary}"
                 markdown_results.append(result_block)
 
@@ -85,7 +89,7 @@ class GlobalNewsAggregator:
 
             # Write Initial Global Summary
             initial_summary_content = "\n\n".join(markdown_results)
-            date_str = datetime.now().strftime("%Y-%m-%d")
+            date_str = self.run_date_str
 
             os.makedirs(self.output_dir, exist_ok=True)
             output_filename = f"{date_str}-global-events-summary.md"
@@ -160,7 +164,7 @@ class GlobalNewsAggregator:
                 return
 
             p2_path = os.path.join(self.output_dir, "p2_articles_with_titles.csv")
-            df_with_titles.to_csv(p2_path, index=False)
+            CSVHandler.save_dataframe(df_with_titles, p2_path)
             self.logger.info(f"Phase 2 Complete. Titles saved to '{p2_path}'")
 
             # Phase 3: Region Categorization
@@ -184,7 +188,7 @@ class GlobalNewsAggregator:
 
             # Save results
             p3_path = os.path.join(self.output_dir, "p3_articles_with_regions.csv")
-            df_with_titles.to_csv(p3_path, index=False)
+            CSVHandler.save_dataframe(df_with_titles, p3_path)
             self.logger.info(f"Phase 3 Complete. Regions saved to '{p3_path}'")
 
             self.logger.info("--- News ETL Workflow Complete ---")
@@ -210,12 +214,12 @@ class GlobalNewsAggregator:
                 )
                 return
 
-            df_with_regions = pd.read_csv(input_csv_path)
+            df_with_regions = CSVHandler.load_as_dataframe(input_csv_path)
 
             generator = MarkdownGenerator(
                 input_df=df_with_regions,
                 output_directory=self.output_dir,
-                current_date=datetime.now(),
+                current_date=self.run_datetime,
             )
             generator.generate_markdown_post()
             self.logger.info("News Post Construction Complete.")
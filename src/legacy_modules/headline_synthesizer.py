@@ -2,17 +2,20 @@
 
 import logging
 import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
 
-from dateutil import parser as date_parser
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 from langchain_community.llms import Ollama
 from langchain_core.output_parsers import StrOutputParser
 from langchain_core.prompts import PromptTemplate
 
+from managers.cache_manager import CacheManager
+
 # --- Future Work ---
 
 # TODO: synthesize webpage articles
@@ -24,6 +27,18 @@ logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
 )
 
+# Handle -> uploads playlist rarely changes; re-resolve monthly (or on a 404)
+CHANNEL_CACHE_TTL_SECONDS = 30 * 24 * 60 * 60
+
+# Channels fetched concurrently by synthesize_many; kept low to avoid throttling
+MAX_CHANNEL_WORKERS = 5
+
+# Retries (with exponential backoff) googleapiclient applies to 429/5xx responses
+API_RETRIES = 3
+
+# Channel handle (e.g. '@ChannelName') from a youtube.com channel URL
+_HANDLE_RE = re.compile(r"youtube\.com/(@[A-Za-z0-9_.-]+)")
+
 # --- LLM Prompt Template  ---
 PROMPT_TEMPLATE = PromptTemplate.from_template(
     """
@@ -83,8 +98,12 @@ class HeadlineSynthesizer:
             api_key (str): Your YouTube Data API v3 key.
             model (str): The Ollama model to use for synthesis.
         """
+        self.api_key = api_key
+        # googleapiclient services are not thread-safe; each thread gets its own
+        self._thread_local = threading.local()
         try:
             self.youtube_service = build("youtube", "v3", developerKey=api_key)
+            self._thread_local.service = self.youtube_service
             logging.info("YouTube API service initialized successfully.")
         except Exception as e:
             logging.error(
@@ -92,6 +111,12 @@ class HeadlineSynthesizer:
             )
             raise
 
+        # Handle -> [uploads playlist ID, channel title], saving the channels
+        # lookup on every run
+        self.channel_cache = CacheManager(
+            "youtube_channels", ttl_seconds=CHANNEL_CACHE_TTL_SECONDS
+        )
+
         try:
             llm = Ollama(model=model, temperature=0.0)
             self.llm_chain = PROMPT_TEMPLATE | llm | StrOutputParser()
@@ -102,6 +127,15 @@ class HeadlineSynthesizer:
             )
             raise
 
+    @property
+    def youtube(self):
+        """Returns the calling thread's YouTube service, building it on first use."""
+        service = getattr(self._thread_local, "service", None)
+        if service is None:
+            service = build("youtube", "v3", developerKey=self.api_key)
+            self._thread_local.service = service
+        return service
+
     def _fetch_headlines_youtube(
         self, channel_name: str, channel_url: str
     ) -> List[str]:
@@ -118,7 +152,7 @@ class HeadlineSynthesizer:
         """
         logging.info(f"Fetching headlines for '{channel_name}'...")
 
-        handle_match = re.search(r"youtube\.com/(@[A-Za-z0-9_.-]+)", channel_url)
+        handle_match = _HANDLE_RE.search(channel_url)
         if not handle_match:
             logging.error(f"Could not extract a valid @handle from URL: {channel_url}")
             return []
@@ -126,23 +160,12 @@ class HeadlineSynthesizer:
         handle = handle_match.group(1)
 
         try:
-            search_req = self.youtube_service.search().list(
-                q=handle, part="id", type="channel", maxResults=1
-            )
-            search_res = search_req.execute()
-            if not search_res.get("items"):
-                logging.error(f"Could not find channelId for handle '{handle}'.")
+            resolved = self._resolve_uploads_playlist(handle)
+            if not resolved:
                 return []
-            channel_id = search_res["items"][0]["id"]["channelId"]
-
-            # Get uploads playlist ID and verify channel name by requesting 'snippet'
-            channel_req = self.youtube_service.channels().list(
-                id=channel_id, part="contentDetails,snippet"
-            )
-            channel_res = channel_req.execute()
+            uploads_id, fetched_channel_name = resolved
 
             # --- Channel Name Verification ---
-            fetched_channel_name = channel_res["items"][0]["snippet"]["title"]
             logging.info(
                 f"Verifying channel name. Expected: '{channel_name}', Fetched from API: '{fetched_channel_name}'"
             )
@@ -151,20 +174,22 @@ class HeadlineSynthesizer:
                     f"Potential channel name mismatch. The name '{channel_name}' was not found in the fetched name '{fetched_channel_name}'."
                 )
 
-            uploads_id = channel_res["items"][0]["contentDetails"]["relatedPlaylists"][
-                "uploads"
-            ]
-
             one_week_ago = datetime.now(timezone.utc) - timedelta(days=7)
-            playlist_req = self.youtube_service.playlistItems().list(
-                playlistId=uploads_id, part="snippet", maxResults=60
+            playlist_req = self.youtube.playlistItems().list(
+                playlistId=uploads_id,
+                part="snippet",
+                maxResults=60,
+                fields="items(snippet(title,publishedAt))",
             )
-            playlist_res = playlist_req.execute()
+            playlist_res = playlist_req.execute(num_retries=API_RETRIES)
 
             titles = []
             for item in playlist_res.get("items", []):
                 snippet = item["snippet"]
-                published_date = date_parser.isoparse(snippet["publishedAt"])
+                # fromisoformat only accepts a trailing 'Z' from Python 3.11
+                published_date = datetime.fromisoformat(
+                    snippet["publishedAt"].replace("Z", "+00:00")
+                )
                 if published_date >= one_week_ago:
                     titles.append(snippet["title"])
 
@@ -173,12 +198,51 @@ class HeadlineSynthesizer:
             return titles
 
         except HttpError as e:
+            if e.resp.status == 404:
+                # The cached playlist may be gone; resolve it afresh next run
+                self.channel_cache.delete(handle)
             logging.error(f"An HTTP error occurred for '{channel_name}': {e}")
             return []
         except Exception as e:
             logging.error(f"An unexpected error occurred for '{channel_name}': {e}")
             return []
 
+    def _resolve_uploads_playlist(self, handle: str) -> Optional[Tuple[str, str]]:
+        """
+        Resolves a channel handle to its uploads playlist ID and channel title,
+        using the on-disk cache when possible.
+
+        Args:
+            handle (str): The channel handle, e.g. '@ChannelName'.
+
+        Returns:
+            (uploads_id, channel_title), or None if the channel was not found.
+        """
+        cached = self.channel_cache.get(handle)
+        if cached:
+            logging.info(f"Using cached channel details for '{handle}'.")
+            return cached[0], cached[1]
+
+        # forHandle resolves the handle directly (1 quota unit, versus 100 for a
+        # search); 'snippet' supplies the channel name
+        channel_req = self.youtube.channels().list(
+            forHandle=handle,
+            part="contentDetails,snippet",
+            maxResults=1,
+            fields="items(contentDetails/relatedPlaylists/uploads,snippet/title)",
+        )
+        channel_res = channel_req.execute(num_retries=API_RETRIES)
+        if not channel_res.get("items"):
+            logging.error(f"Could not find channel for handle '{handle}'.")
+            return None
+
+        item = channel_res["items"][0]
+        uploads_id = item["contentDetails"]["relatedPlaylists"]["uploads"]
+        channel_title = item["snippet"]["title"]
+
+        self.channel_cache.set(handle, [uploads_id, channel_title])
+        return uploads_id, channel_title
+
     def _synthesize_headlines_llm(self, channel_name: str, headlines: List[str]) -> str:
         """
         Uses an Ollama model to synthesize a list of headlines into a summary.
@@ -227,3 +291,21 @@ class HeadlineSynthesizer:
         headlines = self._fetch_headlines_youtube(channel["name"], channel["url"])
         # summary = self._synthesize_headlines_llm(channel["name"], headlines)
         return headlines
+
+    def synthesize_many(self, channels: List[Dict[str, str]]) -> List[str]:
+        """
+        Runs synthesize_channel_activity for several channels concurrently.
+
+        Args:
+            channels (List[Dict[str, str]]): Dictionaries with 'name' and 'url'.
+
+        Returns:
+            One result per channel, in the same order as channels.
+        """
+        if not channels:
+            return []
+
+        with ThreadPoolExecutor(
+            max_workers=min(MAX_CHANNEL_WORKERS, len(channels))
+        ) as executor:
+            return list(executor.map(self.synthesize_channel_activity, channels))
@@ -1,26 +1,46 @@
 # Legacy module: retained for compatibility and slated for migration or deprecation.
 
 import os
+import json
 import logging
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List
+from functools import cached_property
+from pathlib import Path
+from typing import List, Optional, Tuple
 from legacy_modules.content_extractor import ContentExtractor
 from legacy_modules.llm_client import LLMClient
+from managers.cache_manager import CacheManager
 
 logger = logging.getLogger(__name__)
 
+MAX_FETCH_WORKERS = 8  # Concurrent link extractions
+DEFAULT_TITLE = "Historical Materialist Analysis"
+CONTENT_CACHE_TTL_SECONDS = 7 * 24 * 60 * 60  # Re-scrape links older than a week
 
-TITLE_GENERATION_PROMPT = """
+# Outermost {...} block, for models that wrap the JSON reply in prose or fences
+_JSON_OBJECT_RE = re.compile(r"\{.*\}", re.DOTALL)
+# Surrounding ``` fence (with optional language tag) on a plain-text reply
+_CODE_FENCE_RE = re.compile(r"^\s*```[\w-]*\n(.*?)\n?```\s*$", re.DOTALL)
+
+# Filename sanitising patterns, compiled once at import
+_SANITIZE_NONWORD = re.compile(r"[^\w\s-]")
+_SANITIZE_WHITESPACE = re.compile(r"[-\s]+")
+
+# Static instructions go in the system message and the per-run text in the user
+# message, so the long prefix is byte-identical across runs and cacheable upstream.
+TITLE_SYSTEM_PROMPT = """
 You are an editor. Read the following analysis and generate a short, descriptive title (maximum 8 words).
 The title must be concise and specific to the content (e.g., "Thailand-Cambodia Border Conflict 2025").
 Do not use colons, slashes, or special characters. Do not use Markdown. Just return the plain text title.
+"""
 
-ANALYSIS TEXT:
+TITLE_USER_TEMPLATE = """ANALYSIS TEXT:
 {analysis_text}
 """
 
-HMA_PROMPT = """
+HMA_SYSTEM_PROMPT = """
 ### OVERVIEW
 You are a critical political economy and geopolitical analyst, inspired by the frameworks of Michael Hudson, Radhika Desai, and Ben Norton.
 
@@ -157,10 +177,15 @@ Analyze the provided "Raw Research Transcripts" below and produce a comprehensiv
 
 ### END OF EXAMPLE
 
-### RAW RESEARCH TRANSCRIPTS
-{transcripts}
+### RESPONSE FORMAT
+Return ONLY a JSON object with exactly these two keys:
+- "title": a short, descriptive title for the report (maximum 8 words). Do not use colons, slashes, special characters, or Markdown.
+- "analysis": the full Markdown report following the structure above.
 """
 
+# Prepended to the transcripts as-is (no str.format pass over the large body)
+HMA_TRANSCRIPTS_HEADER = "### RAW RESEARCH TRANSCRIPTS\n"
+
 
 class HistoricalMaterialistResearcher:
     """
@@ -178,13 +203,25 @@ class HistoricalMaterialistResearcher:
 
         # --- State Variables ---
         self.current_transcripts_path = None
+        self._compiled_content: Optional[str] = None  # Last transcript written
+        self._run_date = datetime.now().strftime("%Y-%m-%d")  # Shared by both phases
         self.research_links: List[
             str
         ] = []  # Stores links in memory to avoid re-reading files
 
-        # --- Helpers ---
-        self.extractor = ContentExtractor(config)
-        self.llm = LLMClient(config)
+        # --- Helpers (extractor and llm are built on first use) ---
+        self._config = config
+        self.content_cache = CacheManager(
+            "research_content", ttl_seconds=CONTENT_CACHE_TTL_SECONDS
+        )
+
+    @cached_property
+    def extractor(self) -> ContentExtractor:
+        return ContentExtractor(self._config)
+
+    @cached_property
+    def llm(self) -> LLMClient:
+        return LLMClient(self._config)
 
     def conduct_research(
         self,
@@ -197,6 +234,10 @@ class HistoricalMaterialistResearcher:
         """
         logger.info("=== Starting Historical Materialist Research Workflow ===")
 
+        # One date for the whole run, so transcript and analysis filenames match
+        # even if the manual review crosses midnight
+        self._run_date = datetime.now().strftime("%Y-%m-%d")
+
         # Step 1: Compile Materials (Populates self.research_links)
         self._compile_research_material()
 
@@ -215,7 +256,8 @@ class HistoricalMaterialistResearcher:
             logger.info("Resuming workflow after manual review.")
 
         # Step 3: Generate Analysis (Uses self.research_links for citations)
-        self._generate_analysis(provider=provider, model=model)
+        # The transcript is only re-read from disk if the user may have edited it
+        self._generate_analysis(provider=provider, model=model, edited=manual_review)
 
         logger.info("=== Research Workflow Complete ===")
 
@@ -240,42 +282,112 @@ class HistoricalMaterialistResearcher:
 
         logger.info(f"Loaded {len(self.research_links)} links into memory.")
 
-        # 2. Extract Content
-        compiled_content = (
-            f"# Raw Research Transcripts | {datetime.now().strftime('%Y-%m-%d')}\n\n"
-        )
-
+        # Each distinct URL is fetched once; the transcript still lists every link
+        unique_links = list(dict.fromkeys(self.research_links))
+        duplicates = len(self.research_links) - len(unique_links)
+        if duplicates:
+            logger.warning(f"Skipping {duplicates} duplicate link(s) when fetching.")
+
+        # 2. Extract Content (network-bound, so links are fetched concurrently)
+        _ = self.extractor  # Built once here, not raced for by the worker threads
+        with ThreadPoolExecutor(
+            max_workers=min(MAX_FETCH_WORKERS, len(unique_links))
+        ) as executor:
+            futures = {}
+            for index, url in enumerate(unique_links):
+                logger.info(f"Processing ({index + 1}/{len(unique_links)}): {url}")
+                futures[url] = executor.submit(self._cached_get_text, url)
+
+        date_str = self._run_date
+        parts = [f"# Raw Research Transcripts | {date_str}\n\n"]
+
+        # Results are assembled in link order
         for index, url in enumerate(self.research_links):
-            logger.info(f"Processing ({index+1}/{len(self.research_links)}): {url}")
             try:
-                text_content = self.extractor.get_text(url)
-                compiled_content += f"## Source {index+1}: {url}\n{'-'*40}\n{text_content}\n{'-'*40}\n\n"
+                text_content = futures[url].result()
+                parts.append(
+                    f"## Source {index + 1}: {url}\n{'-' * 40}\n{text_content}\n{'-' * 40}\n\n"
+                )
             except Exception as e:
                 logger.error(f"Error processing {url}: {e}")
-                compiled_content += (
-                    f"## Source {index+1}: {url}\n[FAILED TO RETRIEVE CONTENT]\n\n"
+                parts.append(
+                    f"## Source {index + 1}: {url}\n[FAILED TO RETRIEVE CONTENT]\n\n"
                 )
 
+        # Joined once: linear in the total size, unlike repeated +=
+        compiled_content = "".join(parts)
+
         # 3. Save Output
-        date_str = datetime.now().strftime("%Y-%m-%d")
         os.makedirs(self.output_directory, exist_ok=True)
         output_filename = f"{date_str}_raw_transcripts.md"
         output_path = os.path.join(self.output_directory, output_filename)
 
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(compiled_content)
+        Path(output_path).write_bytes(compiled_content.encode("utf-8"))
 
         logger.info(f"Transcripts saved to: {output_path}")
         self.current_transcripts_path = output_path
+        self._compiled_content = compiled_content
         return output_path
 
+    def _cached_get_text(self, url: str) -> str:
+        """
+        Returns the extracted text for url, re-using content scraped by an
+        earlier run. Empty or error results are never cached.
+        """
+        cached = self.content_cache.get(url)
+        if cached is not None:
+            logger.info(f"Using cached content for: {url}")
+            return cached
+
+        text_content = self.extractor.get_text(url)
+        if text_content and not text_content.startswith("[Error"):
+            self.content_cache.set(url, text_content)
+        return text_content
+
     def _sanitize_filename(self, name: str) -> str:
         """Removes illegal characters for filenames."""
-        name = re.sub(r"[^\w\s-]", "", name)
-        name = re.sub(r"[-\s]+", "_", name)
+        name = _SANITIZE_NONWORD.sub("", name)
+        name = _SANITIZE_WHITESPACE.sub("_", name)
         return name.strip()
 
-    def _generate_analysis(self, provider: str, model: str) -> str:
+    def _parse_analysis_response(self, response: str) -> Tuple[str, str]:
+        """
+        Splits the model's JSON reply into (title, analysis).
+        If no valid JSON envelope is found, the whole reply (minus any code
+        fence) is the analysis and the title is empty.
+        """
+        match = _JSON_OBJECT_RE.search(response or "")
+        if match:
+            try:
+                # strict=False tolerates raw newlines inside the markdown string
+                data = json.loads(match.group(0), strict=False)
+                if isinstance(data, dict) and data.get("analysis"):
+                    return str(data.get("title") or "").strip(), str(data["analysis"])
+            except json.JSONDecodeError:
+                pass
+
+        logger.warning("Analysis reply was not a JSON envelope; using it as Markdown.")
+        response = response or ""
+        fenced = _CODE_FENCE_RE.match(response)
+        return "", fenced.group(1) if fenced else response
+
+    def _generate_title(self, analysis_text: str, provider: str) -> str:
+        """Separate title request, used only when the analysis reply had no title."""
+        logger.info("Generating title for the analysis...")
+        title_prompt = TITLE_USER_TEMPLATE.format(analysis_text=analysis_text[:5000])
+
+        try:
+            return self.llm.query(
+                prompt=title_prompt,
+                provider=provider,
+                model="GPT-4o",
+                system=TITLE_SYSTEM_PROMPT,
+            )
+        except Exception as e:
+            logger.warning(f"Title generation failed: {e}. Using default.")
+            return DEFAULT_TITLE
+
+    def _generate_analysis(self, provider: str, model: str, edited: bool = True) -> str:
         """
         Internal: Uses in-memory links and transcript file to generate final analysis.
         """
@@ -287,54 +399,49 @@ class HistoricalMaterialistResearcher:
             logger.error("No transcript file found to analyze.")
             return ""
 
-        # Read the (potentially edited) transcript file
-        with open(self.current_transcripts_path, encoding="utf-8") as f:
-            raw_content = f.read()
+        if edited or self._compiled_content is None:
+            # Read the (potentially edited) transcript file
+            with open(self.current_transcripts_path, encoding="utf-8") as f:
+                raw_content = f.read()
+        else:
+            raw_content = self._compiled_content
 
-        # --- A. Generate Main Analysis ---
-        full_prompt = HMA_PROMPT.format(transcripts=raw_content)
+        # --- A. Generate Analysis and Title (single request) ---
+        user_prompt = HMA_TRANSCRIPTS_HEADER + raw_content
 
         try:
             logger.info(f"Querying {provider} ({model}) for analysis...")
-            analysis_text = self.llm.query(
-                prompt=full_prompt, provider=provider, model=model
+            response = self.llm.query(
+                prompt=user_prompt,
+                provider=provider,
+                model=model,
+                system=HMA_SYSTEM_PROMPT,
             )
         except Exception as e:
             logger.error(f"Analysis generation failed: {e}")
             return ""
 
-        # --- B. Generate Title ---
-        logger.info("Generating title for the analysis...")
-        title_prompt = TITLE_GENERATION_PROMPT.format(
-            analysis_text=analysis_text[:5000]
-        )
+        raw_title, analysis_text = self._parse_analysis_response(response)
 
-        try:
-            raw_title = self.llm.query(
-                prompt=title_prompt, provider=provider, model="GPT-4o"
-            )
-            sanitized_title = self._sanitize_filename(raw_title)
-        except Exception as e:
-            logger.warning(f"Title generation failed: {e}. Using default.")
-            raw_title = "Historical Materialist Analysis"
-            sanitized_title = "analysis"
+        # --- B. Fallback Title (only when the reply carried none) ---
+        if not raw_title:
+            raw_title = self._generate_title(analysis_text, provider)
+        sanitized_title = self._sanitize_filename(raw_title) or "analysis"
 
         # --- C. Append Sources (From Class Variable) ---
         sources_section = ""
         if self.research_links:
-            sources_section = "\n\n---\n### Sources\n"
-            for link in self.research_links:
-                sources_section += f"- {link}\n"
+            sources_section = "\n\n---\n### Sources\n" + "".join(
+                f"- {link}\n" for link in self.research_links
+            )
 
         # --- D. Final Assembly & Save ---
         final_content = f"# {raw_title}\n\n{analysis_text}{sources_section}"
 
-        date_str = datetime.now().strftime("%Y-%m-%d")
-        output_filename = f"{date_str}-hma-{sanitized_title}.md"
+        output_filename = f"{self._run_date}-hma-{sanitized_title}.md"
         output_path = os.path.join(self.output_directory, output_filename)
 
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(final_content)
+        Path(output_path).write_bytes(final_content.encode("utf-8"))
 
         logger.info(f"Analysis saved to: {output_path}")
         return output_path
@@ -1,38 +1,71 @@
 # Legacy module: retained for compatibility and slated for migration or deprecation.
 
+import asyncio
+import hashlib
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Union
+
+import httpx
 import openai
 from langchain_community.llms import Ollama
 
+from managers.cache_manager import CacheManager
+
 logger = logging.getLogger(__name__)
 
+# Connection pool sized for batched/parallel summaries sharing keep-alive connections
+POE_HTTP_LIMITS = httpx.Limits(
+    max_keepalive_connections=20, max_connections=50, keepalive_expiry=60.0
+)
+POE_HTTP_TIMEOUT = httpx.Timeout(120.0, connect=10.0)
+# Concurrent batches can hit rate limits; the OpenAI SDK retries 429/5xx
+# responses with exponential backoff (honouring Retry-After) up to this many times
+POE_MAX_RETRIES = 4
+
 
 class LLMClient:
     """
     A unified interface for prompting different LLM providers (Poe via OpenAI protocol, Ollama).
     """
 
-    def __init__(self, config: dict):
+    def __init__(self, config: dict, response_cache: Optional[CacheManager] = None):
         """
         Args:
             config (dict): Configuration dictionary containing API keys and defaults.
                            e.g., {"api_keys": {"poe_api": "..."}}
+            response_cache (Optional[CacheManager]): When given, responses are stored
+                per exact (provider, model, system, prompt) and identical queries are
+                answered from it. Queries run at temperature 0, so reuse is safe.
         """
         self.config = config
+        self.response_cache = response_cache
         self.poe_api_key = config.get("api_keys", {}).get("poe_api")
 
+        # The asyncio Poe client binds its connections to the running event loop,
+        # so it is opened on first async use and released by aclose() per run
+        self.poe_async_client: Optional[openai.AsyncOpenAI] = None
+
         # Initialize Poe Client (OpenAI-compatible)
         if self.poe_api_key:
             self.poe_client = openai.OpenAI(
                 api_key=self.poe_api_key,
                 base_url="https://api.poe.com/v1",
+                max_retries=POE_MAX_RETRIES,
+                http_client=httpx.Client(
+                    limits=POE_HTTP_LIMITS, timeout=POE_HTTP_TIMEOUT
+                ),
             )
         else:
             self.poe_client = None
             logger.warning("Poe API key missing. Poe provider will be unavailable.")
 
     def query(
-        self, prompt: str, provider: str = "poe", model: str = "Gemini-2.5-Pro"
+        self,
+        prompt: str,
+        provider: str = "poe",
+        model: str = "Gemini-2.5-Pro",
+        system: Optional[str] = None,
     ) -> str:
         """
         Public method to query an LLM.
@@ -41,24 +74,156 @@ class LLMClient:
             prompt (str): The text prompt to send.
             provider (str): "poe" or "ollama".
             model (str): The specific model name (e.g., "Gemini-2.5-Pro", "qwen2.5:32b").
+            system (Optional[str]): Static instructions sent ahead of the prompt as a
+                system message. Keeping them byte-identical across calls lets
+                providers reuse their cached prefix.
 
         Returns:
             str: The generated response.
         """
+        key = self._response_key(prompt, provider, model, system)
+        cached = self._get_cached_response(key)
+        if cached is not None:
+            return cached
+
         if provider.lower() == "poe":
-            return self._query_poe(prompt, model)
+            response = self._query_poe(prompt, model, system)
         elif provider.lower() == "ollama":
-            return self._query_ollama(prompt, model)
+            response = self._query_ollama(prompt, model, system)
+        else:
+            raise ValueError(f"Unknown provider: {provider}")
+
+        self._cache_response(key, response)
+        return response
+
+    def query_batch(
+        self,
+        prompts: List[str],
+        provider: str = "poe",
+        model: str = "Gemini-2.5-Pro",
+        max_workers: int = 8,
+    ) -> List[Union[str, Exception]]:
+        """
+        Sends several prompts concurrently (bounded by max_workers) so their
+        network round-trips overlap instead of running back to back.
+
+        Args:
+            prompts (List[str]): The prompts to send.
+            provider (str): "poe" or "ollama".
+            model (str): The specific model name.
+            max_workers (int): Maximum number of requests in flight.
+
+        Returns:
+            List[Union[str, Exception]]: One entry per prompt, in input order: the
+            response text, or the exception raised for that prompt.
+        """
+        if not prompts:
+            return []
+
+        def _safe_query(prompt: str) -> Union[str, Exception]:
+            try:
+                return self.query(prompt=prompt, provider=provider, model=model)
+            except Exception as e:
+                return e
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(prompts))) as executor:
+            return list(executor.map(_safe_query, prompts))
+
+    async def query_async(
+        self,
+        prompt: str,
+        provider: str = "poe",
+        model: str = "Gemini-2.5-Pro",
+        system: Optional[str] = None,
+    ) -> str:
+        """
+        Async counterpart of query(), so many prompts can be in flight at once.
+        Ollama has no async client here and runs in a worker thread instead.
+
+        Args:
+            prompt (str): The text prompt to send.
+            provider (str): "poe" or "ollama".
+            model (str): The specific model name.
+            system (Optional[str]): Optional system message, as in query().
+
+        Returns:
+            str: The generated response.
+        """
+        key = self._response_key(prompt, provider, model, system)
+        cached = self._get_cached_response(key)
+        if cached is not None:
+            return cached
+
+        if provider.lower() == "poe":
+            response = await self._query_poe_async(prompt, model, system)
+        elif provider.lower() == "ollama":
+            response = await asyncio.to_thread(
+                self._query_ollama, prompt, model, system
+            )
         else:
             raise ValueError(f"Unknown provider: {provider}")
 
-    def _query_poe(self, prompt: str, model: str) -> str:
+        self._cache_response(key, response)
+        return response
+
+    async def aclose(self) -> None:
+        """
+        Closes the asyncio Poe client opened by query_async(). Call it before the
+        event loop ends (e.g. at the end of each asyncio.run); the next async
+        query opens a fresh client on the then-running loop.
+        """
+        if self.poe_async_client is not None:
+            client, self.poe_async_client = self.poe_async_client, None
+            await client.close()
+
+    def _response_key(
+        self, prompt: str, provider: str, model: str, system: Optional[str]
+    ) -> Optional[str]:
+        """Cache key for an exact query, or None when no response cache is set."""
+        if self.response_cache is None:
+            return None
+        parts = (provider.lower(), model, system or "", prompt)
+        return hashlib.blake2b("\x00".join(parts).encode("utf-8")).hexdigest()
+
+    def _get_cached_response(self, key: Optional[str]) -> Optional[str]:
+        if key is None:
+            return None
+        response = self.response_cache.get(key)
+        if response is not None:
+            logger.info("Using cached LLM response.")
+        return response
+
+    def _cache_response(self, key: Optional[str], response: str) -> None:
+        """Stores non-empty responses; empty ones are retried on the next call."""
+        if key is not None and response:
+            self.response_cache.set(key, response)
+
+    def _build_messages(
+        self, prompt: str, system: Optional[str]
+    ) -> List[Dict[str, str]]:
+        """Static system prefix first, then the per-call user prompt."""
+        messages = [{"role": "user", "content": prompt}]
+        if system:
+            messages.insert(0, {"role": "system", "content": system})
+        return messages
+
+    def _log_cache_usage(self, model: str, response) -> None:
+        """Logs prompt tokens served from the provider's prefix cache, when reported."""
+        usage = getattr(response, "usage", None)
+        details = getattr(usage, "prompt_tokens_details", None)
+        cached_tokens = getattr(details, "cached_tokens", None)
+        if cached_tokens is not None:
+            logger.info(
+                f"Poe ({model}) | Prompt tokens: {usage.prompt_tokens} (cached: {cached_tokens})"
+            )
+
+    def _query_poe(self, prompt: str, model: str, system: Optional[str] = None) -> str:
         if not self.poe_client:
             raise RuntimeError("Poe client not initialized. Check API key.")
 
         try:
             # Metrics
-            char_len = len(prompt)
+            char_len = len(prompt) + len(system or "")
             est_tokens = char_len // 4
             logger.info(
                 f"Querying Poe ({model}) | Input Context: {char_len} chars (~{est_tokens} tokens)"
@@ -66,25 +231,62 @@ class LLMClient:
 
             response = self.poe_client.chat.completions.create(
                 model=model,
-                messages=[{"role": "user", "content": prompt}],
+                messages=self._build_messages(prompt, system),
+                temperature=0.0,
+            )
+            self._log_cache_usage(model, response)
+            return response.choices[0].message.content.strip()
+        except Exception as e:
+            logger.error(f"Poe API failed: {e}")
+            raise
+
+    async def _query_poe_async(
+        self, prompt: str, model: str, system: Optional[str] = None
+    ) -> str:
+        if not self.poe_api_key:
+            raise RuntimeError("Poe client not initialized. Check API key.")
+
+        if self.poe_async_client is None:
+            self.poe_async_client = openai.AsyncOpenAI(
+                api_key=self.poe_api_key,
+                base_url="https://api.poe.com/v1",
+                max_retries=POE_MAX_RETRIES,
+                http_client=httpx.AsyncClient(
+                    limits=POE_HTTP_LIMITS, timeout=POE_HTTP_TIMEOUT
+                ),
+            )
+
+        try:
+            char_len = len(prompt) + len(system or "")
+            est_tokens = char_len // 4
+            logger.info(
+                f"Querying Poe async ({model}) | Input Context: {char_len} chars (~{est_tokens} tokens)"
+            )
+
+            response = await self.poe_async_client.chat.completions.create(
+                model=model,
+                messages=self._build_messages(prompt, system),
                 temperature=0.0,
             )
+            self._log_cache_usage(model, response)
             return response.choices[0].message.content.strip()
         except Exception as e:
             logger.error(f"Poe API failed: {e}")
             raise
 
-    def _query_ollama(self, prompt: str, model: str) -> str:
+    def _query_ollama(
+        self, prompt: str, model: str, system: Optional[str] = None
+    ) -> str:
         try:
             # Metrics
-            char_len = len(prompt)
+            char_len = len(prompt) + len(system or "")
             est_tokens = char_len // 4
             logger.info(
                 f"Querying Ollama ({model}) | Input Context: {char_len} chars (~{est_tokens} tokens)"
             )
 
             # Using LangChain implementation for Ollama as seen in your existing modules
-            llm = Ollama(model=model, temperature=0.0)
+            llm = Ollama(model=model, temperature=0.0, system=system)
             return llm.invoke(prompt)
         except Exception as e:
             logger.error(f"Ollama query failed: {e}")
@@ -27,6 +27,9 @@ REGION_HEADINGS = {
     "Unknown": "Unknown",
 }
 
+# Characters that break markdown link text, replaced per article title
+_MARKDOWN_BREAKING_RE = re.compile(r"[\|\[\]]")
+
 # YAML Front Matter and basic structure for the Markdown post
 NEWS_POST_TEMPLATE = """---
 layout: post
@@ -66,7 +69,7 @@ class MarkdownGenerator:
 
     def _tidy_title(self, title: str) -> str:
         # Remove characters that break markdown
-        tidy = re.sub(r"[\|\[\]]", " ", title)
+        tidy = _MARKDOWN_BREAKING_RE.sub(" ", title)
         return tidy
 
     def _format_article_line(self, row: pd.Series) -> str:
@@ -84,9 +87,10 @@ class MarkdownGenerator:
         # Prepare the initial part of the post from the template
         date_display = self.current_date.strftime("%d %B %Y")
         date_str = self.current_date.strftime("%Y-%m-%d")
-        post_content = NEWS_POST_TEMPLATE.format(
-            date_display=date_display, date_str=date_str
-        )
+        # Sections are collected in a list and joined once at the end
+        post_parts = [
+            NEWS_POST_TEMPLATE.format(date_display=date_display, date_str=date_str)
+        ]
 
         # Identify which regions are actually present in the DataFrame
         unique_regions_in_df = self.df["region"].unique().tolist()
@@ -106,7 +110,7 @@ class MarkdownGenerator:
         # Build the content for each region, ensuring all headers are included.
         for region_name, heading in REGION_HEADINGS.items():
             # Step 1: ALWAYS add the region header with two newlines after it.
-            post_content += f"\n# {heading}\n\n"
+            post_parts.append(f"\n# {heading}\n\n")
 
             # Step 2: CONDITIONALLY check if this region has articles to add.
             if region_name in unique_regions_in_df:
@@ -115,12 +119,14 @@ class MarkdownGenerator:
                 article_lines = [
                     self._format_article_line(row) for _, row in region_df.iterrows()
                 ]
-                post_content += "\n".join(article_lines)
-                post_content += "\n"  # Add a final newline to separate from the next section header.
+                post_parts.append("\n".join(article_lines))
+                # Add a final newline to separate from the next section header.
+                post_parts.append("\n")
 
         # Add the final empty sections as requested
-        post_content += "\n# In-Depth Analysis\n\n"
-        post_content += "# Special Features\n\n"
+        post_parts.append("\n# In-Depth Analysis\n\n")
+        post_parts.append("# Special Features\n\n")
+        post_content = "".join(post_parts)
 
         # Write the final string to the output file
         try:
@@ -1,5 +1,7 @@
 # Legacy module: retained for compatibility and slated for migration or deprecation.
 
+import asyncio
+import io
 import logging
 import os
 import re
@@ -9,6 +11,21 @@ from legacy_modules.content_summarizer import ContentSummarizer
 
 logger = logging.getLogger(__name__)
 
+# Columns read per article, with the value shown when the CSV lacks them
+ROW_DEFAULTS = {
+    "title": "No Title",
+    "url": "#",
+    "collected_at": "Unknown Date",
+    "source": "Unknown Source",
+}
+CSV_COLUMNS = frozenset(ROW_DEFAULTS) | {"region"}
+SUMMARY_CONCURRENCY = 5  # Articles extracted/summarized at once, below provider limits
+CSV_CHUNK_ROWS = 10_000  # Rows parsed at a time while selecting articles
+
+# Filename sanitising patterns, compiled once at import
+_SANITIZE_NONWORD = re.compile(r"[^\w\s-]")
+_SANITIZE_WHITESPACE = re.compile(r"[-\s]+")
+
 
 class NewsSummariser:
     """
@@ -26,8 +43,8 @@ class NewsSummariser:
         self.summarizer = ContentSummarizer(config=self.config)
 
     def _sanitize_filename(self, name: str) -> str:
-        name = re.sub(r"[^\w\s-]", "", str(name))
-        name = re.sub(r"[-\s]+", "_", name)
+        name = _SANITIZE_NONWORD.sub("", str(name))
+        name = _SANITIZE_WHITESPACE.sub("_", name)
         return name
 
     def _save_file(self, content: str, name: str, directory: str, date_str: str):
@@ -43,95 +60,115 @@ class NewsSummariser:
         except OSError as e:
             logger.error(f"Failed to write file {filepath}: {e}")
 
-    def _summarize_by_region(
-        self, df: pd.DataFrame, output_dir: str, date_str: str, filter_key: str
+    def _fill_defaults(self, df: pd.DataFrame, column: str) -> pd.DataFrame:
+        """
+        Fills absent columns and empty cells of the article fields with their
+        display defaults, once for the whole frame. The grouping column is left
+        untouched so rows without a group are still dropped by groupby.
+        """
+        defaults = {
+            name: value for name, value in ROW_DEFAULTS.items() if name != column
+        }
+        missing = {name: value for name, value in defaults.items() if name not in df}
+        return df.assign(**missing).fillna(defaults)
+
+    def _group_rows(self, group: pd.DataFrame) -> list:
+        """Returns the group's article fields as lightweight namedtuples."""
+        return list(group[list(ROW_DEFAULTS)].itertuples(index=False, name="Row"))
+
+    def _read_selected_rows(
+        self, csv_path: str, column: str, filter_key: str
+    ) -> pd.DataFrame:
+        """
+        Reads the CSV in chunks, keeping only the used columns and, when a
+        filter is given, only rows whose grouping column matches it. Peak
+        memory then follows the selected rows rather than the whole file.
+        """
+        filter_value = (
+            filter_key.lower() if filter_key and filter_key.lower() != "all" else None
+        )
+        selected = []
+        for chunk in pd.read_csv(
+            csv_path,
+            usecols=lambda name: name in CSV_COLUMNS,
+            chunksize=CSV_CHUNK_ROWS,
+        ):
+            if filter_value is not None and column in chunk:
+                chunk = chunk[chunk[column].astype(str).str.lower() == filter_value]
+            selected.append(chunk)
+
+        if not selected:
+            return pd.DataFrame()
+        return pd.concat(selected, ignore_index=True)
+
+    def _summarize_grouped(
+        self, df: pd.DataFrame, column: str, output_dir: str, date_str: str
     ):
         """
-        Handles grouping by Region.
-        Format: # Region Name -> ## Title | Source | Date
+        Summarizes every selected group in one concurrent batch, then writes
+        one markdown file per group.
+        Format: # Group Name -> ## Title | Date | Source Name | URL
         """
+        df = self._fill_defaults(df, column)
+
+        selected_groups = []
+        for group_name, group in df.groupby(column):
+            logger.info(
+                f"Processing {column.title()}: {group_name} ({len(group)} articles)"
+            )
+            selected_groups.append((group_name, self._group_rows(group)))
+
+        # Summaries depend only on the URL, so cross-listed articles are
+        # summarized once and shared between groups.
+        items = {}
+        for group_name, rows in selected_groups:
+            for row in rows:
+                if row.url not in items:
+                    logger.info(f"Summarizing: {row.title}")
+                    items[row.url] = str(group_name)
+
+        if not items:
+            return
+        results = asyncio.run(
+            self.summarizer.summarize_many(
+                [(name, url) for url, name in items.items()],
+                max_concurrency=SUMMARY_CONCURRENCY,
+            )
+        )
+        summaries = dict(zip(items, results))
+
+        for group_name, rows in selected_groups:
+            buffer = io.StringIO()
+            buffer.write(f"# {group_name}\n\n")
+
+            for row in rows:
+                summary = summaries[row.url]
+                buffer.write(
+                    f"## {row.title}\n"
+                    f"collected at: {row.collected_at}\n\n"
+                    f"source name: {row.source}\n\n"
+                    f"source: {row.url}\n\n"
+                    f"{summary}\n\n"
+                    "---\n\n"
+                )
+
+            self._save_file(buffer.getvalue(), group_name, output_dir, date_str)
+
+    def _summarize_by_region(self, df: pd.DataFrame, output_dir: str, date_str: str):
+        """Handles grouping by Region. The summary context is the region name."""
         if "region" not in df.columns:
             logger.error("Column 'region' not found in CSV.")
             return
 
-        grouped = df.groupby("region")
-
-        for region_name, group in grouped:
-            # Apply Filter
-            if (
-                filter_key
-                and str(region_name).lower() != filter_key.lower()
-                and filter_key.lower() != "all"
-            ):
-                continue
-
-            logger.info(f"Processing Region: {region_name} ({len(group)} articles)")
-
-            markdown_content = f"# {region_name}\n\n"
-
-            for _, row in group.iterrows():
-                title = row.get("title", "No Title")
-                url = row.get("url", "#")
-                collected_at = row.get("collected_at", "Unknown Date")
-                source_name = row.get("source", "Unknown Source")
-
-                logger.info(f"Summarizing: {title}")
-                summary = self.summarizer.summarize(str(region_name), url)
-
-                # Context is Source
-                markdown_content += f"## {title}\n"
-                markdown_content += f"collected at: {collected_at}\n\n"
-                markdown_content += f"source name: {source_name}\n\n"
-                markdown_content += f"source: {url}\n\n"
-                markdown_content += f"{summary}\n\n"
-                markdown_content += "---\n\n"
+        self._summarize_grouped(df, "region", output_dir, date_str)
 
-            self._save_file(markdown_content, region_name, output_dir, date_str)
-
-    def _summarize_by_source(
-        self, df: pd.DataFrame, output_dir: str, date_str: str, filter_key: str
-    ):
-        """
-        Handles grouping by Source.
-        Format: # Source Name -> ## Title | Region | Date
-        """
+    def _summarize_by_source(self, df: pd.DataFrame, output_dir: str, date_str: str):
+        """Handles grouping by Source. The summary context is the source name."""
         if "source" not in df.columns:
             logger.error("Column 'source' not found in CSV.")
             return
 
-        grouped = df.groupby("source")
-
-        for source_name, group in grouped:
-            # Apply Filter
-            if (
-                filter_key
-                and str(source_name).lower() != filter_key.lower()
-                and filter_key.lower() != "all"
-            ):
-                continue
-
-            logger.info(f"Processing Source: {source_name} ({len(group)} articles)")
-
-            markdown_content = f"# {source_name}\n\n"
-
-            for _, row in group.iterrows():
-                title = row.get("title", "No Title")
-                url = row.get("url", "#")
-                collected_at = row.get("collected_at", "Unknown Date")
-                source_name = row.get("source", "Unknown Source")
-
-                logger.info(f"Summarizing: {title}")
-                summary = self.summarizer.summarize(str(source_name), url)
-
-                # Context is Region
-                markdown_content += f"## {title}\n"
-                markdown_content += f"collected at: {collected_at}\n\n"
-                markdown_content += f"source name: {source_name}\n\n"
-                markdown_content += f"source: {url}\n\n"
-                markdown_content += f"{summary}\n\n"
-                markdown_content += "---\n\n"
-
-            self._save_file(markdown_content, source_name, output_dir, date_str)
+        self._summarize_grouped(df, "source", output_dir, date_str)
 
     def batch_summarize(self, csv_path: str, mode: str, filter_key: str = None):
         """
@@ -144,9 +181,10 @@ class NewsSummariser:
             logger.error(f"Input CSV not found: {csv_path}")
             return
 
-        df = pd.read_csv(csv_path)
+        # Only the grouping keys, article fields and selected rows are kept
+        df = self._read_selected_rows(csv_path, mode, filter_key)
         if df.empty:
-            logger.warning("Input CSV is empty.")
+            logger.warning("No articles to summarize in the input CSV.")
             return
 
         # Prepare Output Directory
@@ -155,11 +193,15 @@ class NewsSummariser:
         os.makedirs(summaries_dir, exist_ok=True)
 
         # 2. Dispatch to specific logic
-        if mode == "region":
-            self._summarize_by_region(df, summaries_dir, date_str, filter_key)
-        elif mode == "source":
-            self._summarize_by_source(df, summaries_dir, date_str, filter_key)
-        else:
-            logger.error(f"Invalid mode selected: {mode}")
+        try:
+            if mode == "region":
+                self._summarize_by_region(df, summaries_dir, date_str)
+            elif mode == "source":
+                self._summarize_by_source(df, summaries_dir, date_str)
+            else:
+                logger.error(f"Invalid mode selected: {mode}")
+        finally:
+            # Release browsers reused across the batch
+            self.summarizer.close()
 
         logger.info("Batch Summarization Complete.")
@@ -1,10 +1,13 @@
 # Legacy module: retained for compatibility and slated for migration or deprecation.
 
+import asyncio
+import importlib.util
 import logging
 from typing import Optional, List, Dict, Any
+from urllib.parse import urlparse
 
+import httpx
 import pandas as pd
-import requests
 from bs4 import BeautifulSoup
 from selenium import webdriver
 from selenium.common.exceptions import TimeoutException, WebDriverException
@@ -17,6 +20,13 @@ logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
 )
 
+BROWSER_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+WEBPAGE_TIMEOUT = 15
+MAX_CONNECTIONS = 64
+MAX_REQUESTS_PER_HOST = 4  # Avoid hammering a single domain
+# HTTP/2 multiplexing needs the optional 'h2' package
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
 
 class TitleFetcher:
     """
@@ -197,32 +207,65 @@ class TitleFetcher:
             )
             return None
 
-    def _get_webpage_title(self, url: str) -> Optional[str]:
-        """Fetches a webpage title using requests and BeautifulSoup."""
-        logging.info(f"Fetching webpage title for: {url}")
-        try:
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-            }
-            response = requests.get(url, timeout=15, headers=headers)
-            response.raise_for_status()
+    def _parse_title(self, html: str, url: str) -> Optional[str]:
+        """Extracts and cleans the <title> text from a fetched page."""
+        soup = BeautifulSoup(html, "html.parser")
+        title = soup.title.string if soup.title else None
 
-            soup = BeautifulSoup(response.text, "html.parser")
-            title = soup.title.string if soup.title else None
+        if title:
+            cleaned_title = title.strip()
+            logging.info(f"Successfully fetched title: '{cleaned_title}'")
+            return cleaned_title
+        else:
+            logging.warning(f"No <title> tag found for {url}.")
+            return None
 
-            if title:
-                cleaned_title = title.strip()
-                logging.info(f"Successfully fetched title: '{cleaned_title}'")
-                return cleaned_title
-            else:
-                logging.warning(f"No <title> tag found for {url}.")
+    async def _get_webpage_title_async(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        host_semaphores: Dict[str, asyncio.Semaphore],
+    ) -> Optional[str]:
+        """Fetches a webpage title over the shared async client."""
+        host = urlparse(url).netloc
+        semaphore = host_semaphores.setdefault(
+            host, asyncio.Semaphore(MAX_REQUESTS_PER_HOST)
+        )
+        async with semaphore:
+            logging.info(f"Fetching webpage title for: {url}")
+            try:
+                response = await client.get(url)
+                response.raise_for_status()
+                return self._parse_title(response.text, url)
+            except httpx.HTTPError as e:
+                logging.error(f"Could not fetch title for {url}. Request error: {e}")
+                return None
+            except Exception as e:
+                logging.error(f"An unexpected error occurred for {url}: {e}")
                 return None
-        except requests.exceptions.RequestException as e:
-            logging.error(f"Could not fetch title for {url}. Request error: {e}")
-            return None
-        except Exception as e:
-            logging.error(f"An unexpected error occurred for {url}: {e}")
-            return None
+
+    async def _fetch_webpage_titles_async(
+        self, urls: List[str]
+    ) -> Dict[str, Optional[str]]:
+        """
+        Fetches the titles of all webpage URLs concurrently over one pooled
+        client, at most MAX_REQUESTS_PER_HOST at a time per host.
+        """
+        host_semaphores: Dict[str, asyncio.Semaphore] = {}
+        async with httpx.AsyncClient(
+            headers={"User-Agent": BROWSER_USER_AGENT},
+            timeout=WEBPAGE_TIMEOUT,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=MAX_CONNECTIONS),
+            http2=HTTP2_AVAILABLE,
+        ) as client:
+            titles = await asyncio.gather(
+                *(
+                    self._get_webpage_title_async(client, url, host_semaphores)
+                    for url in urls
+                )
+            )
+        return dict(zip(urls, titles))
 
     def _get_title_manually(self, url: str) -> str:
         """Opens a URL and prompts the user to enter the title manually."""
@@ -252,6 +295,20 @@ class TitleFetcher:
         try:
             # --- Phase 1: Automatic Fetching ---
             logging.info("--- Starting Automatic Title Fetching Phase ---")
+
+            # Webpage titles are plain HTTP, so fetch them all concurrently up front
+            formats = (
+                self.df["format"]
+                if "format" in self.df.columns
+                else pd.Series("webpage", index=self.df.index)
+            )
+            webpage_urls = list(dict.fromkeys(self.df.loc[formats == "webpage", "url"]))
+            webpage_titles = (
+                asyncio.run(self._fetch_webpage_titles_async(webpage_urls))
+                if webpage_urls
+                else {}
+            )
+
             for index, row in self.df.iterrows():
                 url = row["url"]
                 source_format = row.get("format", "webpage")
@@ -263,8 +320,8 @@ class TitleFetcher:
                     # _get_youtube_title will call _init_driver internally
                     title = self._get_youtube_title(url)
                 elif source_format == "webpage":
-                    # _get_webpage_title uses requests, no driver needed here
-                    title = self._get_webpage_title(url)
+                    # Fetched concurrently above, no driver needed here
+                    title = webpage_titles.get(url)
                 else:
                     logging.warning(
                         f"Unknown format '{source_format}'. Queuing for manual input."
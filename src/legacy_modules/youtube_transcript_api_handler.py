@@ -1,11 +1,67 @@
 # Legacy module: retained for compatibility and slated for migration or deprecation.
 
+import importlib.util
+import json
 import requests
+import threading
 import time
 import logging
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from managers.cache_manager import CacheManager
 
 logger = logging.getLogger(__name__)
 
+# orjson decodes large transcript payloads faster than the stdlib when installed;
+# both accept the raw response bytes.
+if importlib.util.find_spec("orjson"):
+    import orjson
+
+    _json_loads = orjson.loads
+else:
+    _json_loads = json.loads
+
+# Transcripts don't change once published; keep them for a month
+TRANSCRIPT_CACHE_TTL_SECONDS = 30 * 24 * 60 * 60
+
+# The API allows roughly one request every 2 seconds. Requests reserve the next
+# free slot under a lock, so the budget is shared by all threads and callers
+# only wait when they would actually exceed it.
+MIN_REQUEST_INTERVAL_SECONDS = 2.0
+_rate_limit_lock = threading.Lock()
+_next_request_at = 0.0
+
+
+def _build_session() -> requests.Session:
+    """
+    Keep-alive Session shared by all handlers, so repeated fetches reuse the
+    pooled HTTPS connection. Only failed connections are retried here, since
+    those never reach the API. Error responses (429/5xx) are returned as-is;
+    the caller's retry loop re-sends them through _wait_for_request_slot, so
+    every POST counts against the shared rate limit.
+    """
+    retry = Retry(total=2, connect=2, read=0, status=0, other=0, backoff_factor=0.5)
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10, max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    return session
+
+
+_SESSION = _build_session()
+
+
+def _wait_for_request_slot():
+    """Blocks until this caller's reserved request slot has arrived."""
+    global _next_request_at
+    with _rate_limit_lock:
+        now = time.monotonic()
+        wait = _next_request_at - now
+        _next_request_at = max(now, _next_request_at) + MIN_REQUEST_INTERVAL_SECONDS
+    if wait > 0:
+        logger.debug("Waiting %.2f seconds to respect API rate limits.", wait)
+        time.sleep(wait)
+
 
 class YoutubeTranscriptApiHandler:
     """
@@ -15,7 +71,7 @@ class YoutubeTranscriptApiHandler:
 
     API_URL = "https://www.youtube-transcript.io/api/transcripts"
 
-    def __init__(self, video_id, api_token=None, mock_data=None):
+    def __init__(self, video_id, api_token=None, mock_data=None, cache=None):
         """
         Initializes the handler.
 
@@ -23,6 +79,8 @@ class YoutubeTranscriptApiHandler:
             video_id (str): The YouTube video ID.
             api_token (str, optional): The API key. Required if mock_data is None.
             mock_data (list, optional): Pre-fetched JSON data (useful for testing without making API calls).
+            cache (CacheManager, optional): Store for API responses keyed by video ID.
+                Defaults to the shared 'youtube_transcripts' cache.
         """
         self.video_id = video_id
 
@@ -30,8 +88,18 @@ class YoutubeTranscriptApiHandler:
             logger.info("Using mock data for video_id: %s", video_id)
             self.data = mock_data
         elif api_token:
-            logger.info("Fetching data from API for video_id: %s", video_id)
-            self.data = self._fetch_data(api_token)
+            cache = cache or CacheManager(
+                "youtube_transcripts", ttl_seconds=TRANSCRIPT_CACHE_TTL_SECONDS
+            )
+            self.data = cache.get(video_id)
+            if self.data is not None:
+                logger.info("Using cached data for video_id: %s", video_id)
+            else:
+                logger.info("Fetching data from API for video_id: %s", video_id)
+                self.data = self._fetch_data(api_token)
+                # Only well-formed responses are kept; anything else is re-fetched
+                if isinstance(self.data, list) and self.data:
+                    cache.set(video_id, self.data)
         else:
             logger.error("No api_token or mock_data provided.")
             raise ValueError(
@@ -50,7 +118,8 @@ class YoutubeTranscriptApiHandler:
             logger.debug(
                 "Sending POST request to %s with payload: %s", self.API_URL, payload
             )
-            response = requests.post(self.API_URL, headers=headers, json=payload)
+            _wait_for_request_slot()
+            response = _SESSION.post(self.API_URL, headers=headers, json=payload)
             logger.info("Received response with status code: %s", response.status_code)
             if response.status_code == 429:
                 logger.warning("Rate limit exceeded for video_id: %s", self.video_id)
@@ -59,14 +128,12 @@ class YoutubeTranscriptApiHandler:
                 )
             response.raise_for_status()  # Raise error for bad HTTP status (4xx, 5xx)
             logger.debug("API response JSON: %s", response.text)
-            return response.json()
-        except requests.exceptions.RequestException as e:
+            return _json_loads(response.content)
+        # ValueError covers malformed JSON, which response.json() used to raise
+        # as a RequestException
+        except (requests.exceptions.RequestException, ValueError) as e:
             logger.error("Failed to connect to Transcript API: %s", e)
             raise ConnectionError(f"Failed to connect to Transcript API: {e}")
-        finally:
-            # Always wait 2 econds after each fetch to avoid exceeding the rate limit
-            logger.debug("Sleeping for 2seconds to respect API rate limits.")
-            time.sleep(2)
 
     # --- Helper Methods ---
 
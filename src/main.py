@@ -7,8 +7,11 @@ from datetime import datetime
 
 from legacy_modules.config_manager import ConfigManager
 from legacy_modules.llm_client import LLMClient
+from managers.cache_manager import CacheManager
 from orchestrators.WeeklyIntelOrchestrator import WeeklyIntelOrchestrator
 
+LLM_QUERY_CACHE_TTL_SECONDS = 30 * 24 * 60 * 60
+
 
 def setup_logging(level=logging.INFO):
     """Configures the root logger with a standard format."""
@@ -70,7 +73,13 @@ def main():
         logger.info(f"Configuration loaded from {args.config}")
 
         # 5. Initialize Services
-        llm_client = LLMClient(config)
+        # Identical prompts (e.g. a re-run for the same week) are answered from disk
+        llm_client = LLMClient(
+            config,
+            response_cache=CacheManager(
+                "llm_queries", ttl_seconds=LLM_QUERY_CACHE_TTL_SECONDS
+            ),
+        )
 
         # 6. Initialize Orchestrator
         orchestrator = WeeklyIntelOrchestrator(
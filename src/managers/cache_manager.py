@@ -0,0 +1,104 @@
+import os
+import json
+import time
+import hashlib
+import logging
+import tempfile
+from typing import Any, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_ROOT = os.path.join(
+    os.path.expanduser("~"), ".cache", "news-hub-aggregator"
+)
+
+
+class CacheManager:
+    """
+    Persistent key/value cache that survives between runs.
+    Each entry is stored as its own JSON file, named by the SHA-256 of the key,
+    under <cache_dir>/<namespace>/. Values must be JSON-serializable.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        cache_dir: Optional[str] = None,
+        ttl_seconds: Optional[float] = None,
+    ):
+        """
+        Args:
+            namespace: Sub-folder separating unrelated caches (e.g. 'youtube_handles').
+            cache_dir: Root folder for all caches. Defaults to ~/.cache/news-hub-aggregator.
+            ttl_seconds: Entries older than this are treated as missing. None = never expire.
+        """
+        self.cache_dir = os.path.join(cache_dir or DEFAULT_CACHE_ROOT, namespace)
+        # Joined once; entry paths are then built by concatenation on every lookup
+        self._path_prefix = os.path.join(self.cache_dir, "")
+        self.ttl_seconds = ttl_seconds
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+        except OSError as e:
+            # A cache is an optimisation; an unwritable location just means misses.
+            logger.warning(f"Cache directory {self.cache_dir} unavailable: {e}")
+
+    def _path(self, key: str) -> str:
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return f"{self._path_prefix}{digest}.json"
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Returns the cached value for key, or default if missing, expired or unreadable."""
+        value, _ = self.get_with_age(key, default)
+        return value
+
+    def get_with_age(
+        self, key: str, default: Any = None
+    ) -> Tuple[Any, Optional[float]]:
+        """
+        Like get(), but also returns the entry's age in seconds so callers can
+        apply their own freshness policy (e.g. stale-while-revalidate).
+
+        Returns:
+            (value, age_seconds), or (default, None) if missing, expired or unreadable.
+        """
+        path = self._path(key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return default, None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable cache entry {path}: {e}")
+            return default, None
+
+        age = time.time() - entry.get("created_at", 0)
+        if self.ttl_seconds is not None and age > self.ttl_seconds:
+            return default, None
+
+        return entry.get("value", default), age
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Stores value under key. The file is written to a temp file and renamed,
+        so concurrent readers never see a partial entry. Failures are logged, not raised.
+        """
+        path = self._path(key)
+        entry = {"key": key, "created_at": time.time(), "value": value}
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(entry, f, ensure_ascii=False)
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except Exception as e:
+            logger.warning(f"Failed to write cache entry for '{key}': {e}")
+
+    def delete(self, key: str) -> None:
+        """Removes the entry for key if present."""
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
@@ -41,6 +41,10 @@ from interfaces.models import (
 
 logger = logging.getLogger(__name__)
 
+# libyaml-backed dumper when available; the config is plain data so the safe
+# dumper is sufficient.
+Dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 
 class WeeklyIntelOrchestrator(BaseOrchestrator):
     """
@@ -468,7 +472,13 @@ class WeeklyIntelOrchestrator(BaseOrchestrator):
             backup_path = os.path.join(self.workspace_path, "config_backup.yaml")
             with open(backup_path, "w", encoding="utf-8") as f:
                 # Dumps the config dict as a clean YAML file
-                yaml.dump(self.config, f, default_flow_style=False, sort_keys=False)
+                yaml.dump(
+                    self.config,
+                    f,
+                    Dumper=Dumper,
+                    default_flow_style=False,
+                    sort_keys=False,
+                )
             logger.info(f"   [BACKUP] Configuration saved to: {backup_path}")
         except Exception as e:
             logger.warning(f"   [WARN] Failed to backup config: {e}")
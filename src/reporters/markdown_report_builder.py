@@ -12,6 +12,7 @@ from interfaces.models import (
     GlobalBriefing,
     MultiLensAnalysis,
     MainstreamNarrative,
+    SourceType,
 )
 from reporters.markdown_formatter import MarkdownFormatter
 
@@ -70,9 +71,9 @@ class MarkdownReportBuilder:
             return ReportArtifact(content="\n\n".join(md_buffer), filename=filename)
 
         for entry in data.entries:
-            display_title = f"{entry.source_name} [{entry.source_type.upper()}]"
+            display_title = f"{entry.source_name} [{entry.source_type.value.upper()}]"
             # Logic: Use raw content list or string
-            if entry.source_type == "youtube":
+            if entry.source_type == SourceType.YOUTUBE:
                 inner_content = entry.content
             else:
                 inner_content = entry.content[0] if entry.content else "No content."
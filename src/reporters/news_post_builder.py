@@ -77,10 +77,21 @@ class NewsPostBuilder:
             articles_df["region"] = "Unknown"
         articles_df["region"] = articles_df["region"].fillna("Unknown")
 
+        # Rank and sort once on a local copy; every region slice below is then
+        # already ordered and the caller's 'rank' column is left untouched
+        if not articles_df.empty:
+            if "rank" in articles_df.columns:
+                ranks = pd.to_numeric(articles_df["rank"], errors="coerce").fillna(999)
+            else:
+                ranks = 999
+            articles_df = articles_df.assign(rank=ranks).sort_values(
+                by=["rank", "source"], ascending=[True, True], kind="stable"
+            )
+
         for region_key, region_display in REGION_HEADINGS.items():
             briefing_entry = briefing_map.get(region_key)
             lens_entry = lens_map.get(region_key)
-            region_articles = articles_df[articles_df["region"] == region_key].copy()
+            region_articles = articles_df[articles_df["region"] == region_key]
 
             if not briefing_entry and not lens_entry and region_articles.empty:
                 continue
@@ -124,29 +135,15 @@ class NewsPostBuilder:
 
             # E. Article Links (Ranked)
             if not region_articles.empty:
-                region_articles["rank"] = pd.to_numeric(
-                    region_articles["rank"], errors="coerce"
-                ).fillna(999)
-                region_articles = region_articles.sort_values(
-                    by=["rank", "source"], ascending=[True, True]
-                )
-
                 for _, row in region_articles.iterrows():
                     content.append(self._format_article_line(row))
                 content.append("")
 
         # 4. In-Depth Analysis
-        unknown_articles = articles_df[articles_df["region"] == "Unknown"].copy()
+        unknown_articles = articles_df[articles_df["region"] == "Unknown"]
         if not unknown_articles.empty:
             content.append("# In-Depth Analysis <a id='in-depth-analysis'></a>\n")
 
-            unknown_articles["rank"] = pd.to_numeric(
-                unknown_articles["rank"], errors="coerce"
-            ).fillna(999)
-            unknown_articles = unknown_articles.sort_values(
-                by=["rank", "source"], ascending=[True, True]
-            )
-
             for _, row in unknown_articles.iterrows():
                 content.append(self._format_article_line(row))
             content.append("")
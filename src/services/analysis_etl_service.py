@@ -2,6 +2,7 @@ import logging
 import os
 from typing import Dict, Any
 
+from legacy_modules.csv_handler import CSVHandler
 from legacy_modules.link_collector import LinkCollector
 from legacy_modules.title_fetcher import TitleFetcher
 from legacy_modules.region_categoriser import RegionCategoriser
@@ -72,7 +73,7 @@ class AnalysisETLService:
             return ""
 
         stage_02_path = os.path.join(self.workspace_dir, STAGE_02_FILENAME)
-        df_with_titles.to_csv(stage_02_path, index=False)
+        CSVHandler.save_dataframe(df_with_titles, stage_02_path)
         logger.info(f"Phase 2 Complete. Saved to: {stage_02_path}")
 
         # --- Step 3: Region Categorization ---
@@ -96,7 +97,7 @@ class AnalysisETLService:
         df_with_titles["region"] = regions
 
         stage_03_path = os.path.join(self.workspace_dir, STAGE_03_FILENAME)
-        df_with_titles.to_csv(stage_03_path, index=False)
+        CSVHandler.save_dataframe(df_with_titles, stage_03_path)
         logger.info(f"Phase 3 Complete. Final Dataset: {stage_03_path}")
 
         return stage_03_path
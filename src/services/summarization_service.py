@@ -2,6 +2,7 @@ import logging
 import json
 import os
 from typing import List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from dataclasses import asdict
 
@@ -14,6 +15,7 @@ from interfaces.models import Article, ReportArtifact
 from generators.intel_brief_generator import IntelBriefGenerator
 
 CHECKPOINT_FILENAME = "stage_04_enriched_articles_summarized.jsonl"
+EXTRACTION_WORKERS = 8  # Articles extracted and summarized concurrently per group
 
 logger = logging.getLogger(__name__)
 
@@ -74,6 +76,8 @@ class SummarizationService:
             )
 
             group_articles: List[Article] = []
+            # Misses are extracted and generated below, one pool task per URL
+            pending: Dict[str, Article] = {}
 
             for _, row in group_df.iterrows():
                 url = row.get("url")
@@ -88,30 +92,47 @@ class SummarizationService:
                     group_articles.append(article)
                     continue
 
-                # MISS: Perform work
+                # Duplicate within this group: share the pending Article
+                if url in pending:
+                    group_articles.append(pending[url])
+                    continue
+
+                # MISS: Perform work (content is extracted below)
                 title = row.get("title", "Unknown")
                 source = row.get("source", "Unknown")
 
-                # A. Extraction
-                raw_text = self.extractor.get_text(url)
-
                 article = Article(
                     title=title,
                     source=source,
                     url=url,
-                    raw_content=raw_text,
                     date_collected=datetime.now(),
                 )
-
-                # B. Generation
-                enriched_article = generator.generate(article)
-
-                # Persistence Logic
-                self._append_to_checkpoint(checkpoint_path, enriched_article)
-                # Update local cache so we don't process duplicates in same run
-                processed_cache[url] = enriched_article
-
-                group_articles.append(enriched_article)
+                pending[url] = article
+                group_articles.append(article)
+
+            if pending:
+                # A./B. Extraction and generation run per article on a pool; each
+                # result is checkpointed as it arrives, so an interruption keeps
+                # every article finished so far
+                with ThreadPoolExecutor(
+                    max_workers=min(EXTRACTION_WORKERS, len(pending))
+                ) as executor:
+                    futures = {
+                        executor.submit(self._enrich_article, generator, article): article
+                        for article in pending.values()
+                    }
+                    for future in as_completed(futures):
+                        try:
+                            enriched_article = future.result()
+                        except Exception as e:
+                            # Not checkpointed, so the next run retries it
+                            logger.error(f"Failed to process {futures[future].url}: {e}")
+                            continue
+
+                        # Persistence Logic
+                        self._append_to_checkpoint(checkpoint_path, enriched_article)
+                        # Update local cache so we don't process duplicates in same run
+                        processed_cache[enriched_article.url] = enriched_article
 
             # 6. Build Report for this Group
             # We build the report using ALL articles (both cached and new)
@@ -126,6 +147,11 @@ class SummarizationService:
 
         return generated_artifacts
 
+    def _enrich_article(self, generator: Any, article: Article) -> Article:
+        """Extracts the article's content and generates its summary (worker thread)."""
+        article.raw_content = self.extractor.get_text(article.url)
+        return generator.generate(article)
+
     def _get_generator(self, style: str):
         if style == "intel_brief":
             return IntelBriefGenerator(self.llm_client)
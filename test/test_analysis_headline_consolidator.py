@@ -0,0 +1,48 @@
+import pytest
+
+from consolidators.analysis_headline_consolidator import AnalysisHeadlineConsolidator
+
+# --- Fixtures ---
+
+
+@pytest.fixture
+def headlines_csv(tmp_path):
+    """Writes a small analysis headlines CSV with mixed ranks and sources."""
+    path = tmp_path / "stage_03_enriched_articles_regions.csv"
+    path.write_text(
+        "rank,source,title\n"
+        "2,Beta,Beta first\n"
+        "1,Gamma,Gamma first\n"
+        "1,Alpha,Alpha first\n"
+        "2,Beta,Beta second\n"
+        ",Delta,Delta unranked\n"
+        "1,Alpha,Alpha second\n",
+        encoding="utf-8",
+    )
+    return str(path)
+
+
+# --- Tests ---
+
+
+def test_groups_follow_rank_then_source_order(headlines_csv):
+    """Sources are ordered by rank, then alphabetically; unranked sources go last."""
+    result = AnalysisHeadlineConsolidator(headlines_csv).consolidate()
+
+    names = [group.source_name for group in result.source_groups]
+    assert names == ["Alpha", "Gamma", "Beta", "Delta"]
+
+
+def test_titles_keep_file_order_within_source(headlines_csv):
+    """Titles from the same source are collected in their original order."""
+    result = AnalysisHeadlineConsolidator(headlines_csv).consolidate()
+
+    titles = {group.source_name: group.titles for group in result.source_groups}
+    assert titles["Alpha"] == ["Alpha first", "Alpha second"]
+    assert titles["Beta"] == ["Beta first", "Beta second"]
+
+
+def test_missing_file_returns_empty(tmp_path):
+    """A missing CSV yields an empty container rather than raising."""
+    result = AnalysisHeadlineConsolidator(str(tmp_path / "missing.csv")).consolidate()
+    assert result.source_groups == []
@@ -0,0 +1,68 @@
+import pytest
+
+from managers import cache_manager
+from managers.cache_manager import CacheManager
+
+# --- Fixtures ---
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """A CacheManager rooted in a temporary directory."""
+    return CacheManager("test", cache_dir=str(tmp_path))
+
+
+# --- Tests ---
+
+
+def test_set_then_get_round_trips(cache):
+    """Stored values come back unchanged."""
+    cache.set("@handle", {"uploads": "UU123", "titles": ["a", "b"]})
+    assert cache.get("@handle") == {"uploads": "UU123", "titles": ["a", "b"]}
+
+
+def test_missing_key_returns_default(cache):
+    """Unknown keys return the supplied default."""
+    assert cache.get("missing") is None
+    assert cache.get("missing", "fallback") == "fallback"
+
+
+def test_expired_entry_is_ignored(tmp_path, monkeypatch):
+    """Entries older than the TTL are treated as missing."""
+    cache = CacheManager("test", cache_dir=str(tmp_path), ttl_seconds=60)
+    monkeypatch.setattr(cache_manager.time, "time", lambda: 1000.0)
+    cache.set("key", "value")
+
+    monkeypatch.setattr(cache_manager.time, "time", lambda: 1030.0)
+    assert cache.get("key") == "value"
+
+    monkeypatch.setattr(cache_manager.time, "time", lambda: 1061.0)
+    assert cache.get("key") is None
+
+
+def test_get_with_age_reports_entry_age(tmp_path, monkeypatch):
+    """get_with_age returns the value with its age, and (default, None) on a miss."""
+    cache = CacheManager("test", cache_dir=str(tmp_path))
+    monkeypatch.setattr(cache_manager.time, "time", lambda: 1000.0)
+    cache.set("key", "value")
+
+    monkeypatch.setattr(cache_manager.time, "time", lambda: 1045.0)
+    assert cache.get_with_age("key") == ("value", 45.0)
+    assert cache.get_with_age("missing", "fallback") == ("fallback", None)
+
+
+def test_corrupt_entry_returns_default(cache):
+    """A truncated cache file is ignored instead of raising."""
+    cache.set("key", "value")
+    with open(cache._path("key"), "w", encoding="utf-8") as f:
+        f.write("{not json")
+
+    assert cache.get("key", "fallback") == "fallback"
+
+
+def test_delete_removes_entry(cache):
+    """Deleted keys are no longer returned; deleting twice is harmless."""
+    cache.set("key", "value")
+    cache.delete("key")
+    cache.delete("key")
+    assert cache.get("key") is None
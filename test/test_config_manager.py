@@ -0,0 +1,42 @@
+import os
+
+import pytest
+
+from legacy_modules import config_manager
+from legacy_modules.config_manager import ConfigManager
+
+# --- Fixtures ---
+
+
+@pytest.fixture
+def config_file(tmp_path, monkeypatch):
+    """Writes a small YAML config and starts each test with an empty parse cache."""
+    monkeypatch.setattr(config_manager, "_PARSE_CACHE", {})
+    path = tmp_path / "config.yaml"
+    path.write_text("api_keys:\n  poe: abc\nmodels:\n  - GPT-4o\n", encoding="utf-8")
+    return str(path)
+
+
+# --- Tests ---
+
+
+def test_instances_get_independent_copies(config_file):
+    """A cached parse is reused, but mutating one instance doesn't leak into another."""
+    first = ConfigManager(config_file)
+    first.data["models"].append("Claude")
+
+    second = ConfigManager(config_file)
+    assert second.data == {"api_keys": {"poe": "abc"}, "models": ["GPT-4o"]}
+    assert len(config_manager._PARSE_CACHE) == 1
+
+
+def test_modified_file_is_reparsed(config_file):
+    """Changing the file on disk invalidates the cached parse."""
+    ConfigManager(config_file)
+
+    with open(config_file, "w", encoding="utf-8") as f:
+        f.write("api_keys:\n  poe: changed-key\n")
+    stat = os.stat(config_file)
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert ConfigManager(config_file).data == {"api_keys": {"poe": "changed-key"}}
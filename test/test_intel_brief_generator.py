@@ -0,0 +1,72 @@
+import pytest
+
+from generators.intel_brief_generator import IntelBriefGenerator
+from interfaces.models import Article
+from managers.cache_manager import CacheManager
+
+# --- Fixtures ---
+
+
+class FakeLLMClient:
+    """Records batched prompts and answers each with a canned brief."""
+
+    def __init__(self):
+        self.batches = []
+
+    def query_batch(self, prompts, provider="poe", model=None, max_workers=8):
+        self.batches.append(list(prompts))
+        return [f"> quoted\nBrief #{len(self.batches)}" for _ in prompts]
+
+
+@pytest.fixture
+def llm_client():
+    return FakeLLMClient()
+
+
+@pytest.fixture
+def generator(llm_client, tmp_path):
+    """An IntelBriefGenerator with its response cache in a temporary directory."""
+    return IntelBriefGenerator(llm_client, CacheManager("llm", cache_dir=str(tmp_path)))
+
+
+def make_article(body: str) -> Article:
+    return Article(title="Title", source="Source", url="http://x", raw_content=body)
+
+
+# --- Tests ---
+
+
+def test_short_content_is_marked_failed_without_llm_call(generator, llm_client):
+    """Articles below the minimum length never reach the LLM."""
+    article = generator.generate(make_article("too short"))
+
+    assert article.summary.startswith("**GENERATION FAILED**")
+    assert llm_client.batches == []
+
+
+def test_generate_many_batches_and_reuses_cached_responses(generator, llm_client):
+    """Misses are sent in one batch; repeated content is served from the cache."""
+    articles = [make_article("a" * 200), make_article("b" * 200)]
+    generator.generate_many(articles)
+
+    assert len(llm_client.batches) == 1
+    assert len(llm_client.batches[0]) == 2
+    assert [a.summary for a in articles] == ["Brief #1", "Brief #1"]
+
+    repeat = generator.generate(make_article("a" * 200))
+
+    assert len(llm_client.batches) == 1
+    assert repeat.summary == "Brief #1"
+
+
+def test_defers_to_client_response_cache(llm_client, tmp_path):
+    """A client that caches responses itself is not wrapped in a second cache."""
+    llm_client.response_cache = CacheManager("llm_queries", cache_dir=str(tmp_path))
+    generator = IntelBriefGenerator(llm_client)
+
+    assert generator.response_cache is None
+
+    generator.generate(make_article("a" * 200))
+    generator.generate(make_article("a" * 200))
+
+    assert len(llm_client.batches) == 2
@@ -0,0 +1,41 @@
+import pytest
+
+from legacy_modules.llm_client import LLMClient
+from managers.cache_manager import CacheManager
+
+# --- Fixtures ---
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    """An LLMClient with a temporary response cache; Poe calls are recorded, not sent."""
+    client = LLMClient({}, response_cache=CacheManager("llm", cache_dir=str(tmp_path)))
+    client.calls = []
+
+    def fake_query_poe(prompt, model, system=None):
+        client.calls.append((prompt, model, system))
+        return "" if prompt == "empty" else f"reply to {prompt}"
+
+    monkeypatch.setattr(client, "_query_poe", fake_query_poe)
+    return client
+
+
+# --- Tests ---
+
+
+def test_identical_query_is_served_from_cache(client):
+    """Repeating the exact query reuses the stored response; any change misses."""
+    assert client.query("hello", model="A") == "reply to hello"
+    assert client.query("hello", model="A") == "reply to hello"
+    assert len(client.calls) == 1
+
+    client.query("hello", model="B")
+    client.query("hello", model="A", system="Be brief.")
+    assert len(client.calls) == 3
+
+
+def test_empty_response_is_not_cached(client):
+    """Empty replies are retried on the next call instead of being reused."""
+    client.query("empty")
+    client.query("empty")
+    assert len(client.calls) == 2
@@ -1,5 +1,6 @@
 import pytest
 
+from managers.cache_manager import CacheManager
 from src.legacy_modules.youtube_transcript_api_handler import (
     YoutubeTranscriptApiHandler,
 )
@@ -88,3 +89,21 @@ def test_missing_keys_raises_error(mock_missing_keys_response):
 
     with pytest.raises(KeyError, match="'microformat' key missing"):
         handler.get_channel_name()
+
+
+def test_api_response_is_cached_by_video_id(mock_valid_response, tmp_path, monkeypatch):
+    """A second handler for the same video reuses the stored response."""
+    calls = []
+
+    def fake_fetch(self, api_token):
+        calls.append(self.video_id)
+        return mock_valid_response
+
+    monkeypatch.setattr(YoutubeTranscriptApiHandler, "_fetch_data", fake_fetch)
+    cache = CacheManager("transcripts", cache_dir=str(tmp_path))
+
+    first = YoutubeTranscriptApiHandler("rrqgBxw3fic", api_token="t", cache=cache)
+    second = YoutubeTranscriptApiHandler("rrqgBxw3fic", api_token="t", cache=cache)
+
+    assert calls == ["rrqgBxw3fic"]
+    assert second.get_transcript_text() == first.get_transcript_text()